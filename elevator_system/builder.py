@@ -146,15 +146,16 @@ class ElevatorSystemBuilder:
         Returns:
             Configured ElevatorController ready to use
         """
+        start_floors = (
+            self._start_floors
+            if self._start_floors
+            else [self._min_floor] * self._num_elevators
+        )
+        observers = tuple(self._observers)
+        
         # Create elevators
         elevators: List[Elevator] = []
-        for i in range(self._num_elevators):
-            start_floor = (
-                self._start_floors[i]
-                if self._start_floors
-                else self._min_floor
-            )
-            
+        for i, start_floor in enumerate(start_floors):
             elevator = Elevator(
                 elevator_id=i,
                 min_floor=self._min_floor,
@@ -164,8 +165,8 @@ class ElevatorSystemBuilder:
             )
             
             # Add observers
-            for observer in self._observers:
-                elevator.add_observer(observer)
+            if observers:
+                elevator.add_observers(observers)
             
             elevators.append(elevator)
         
@@ -8,9 +8,11 @@ This module contains the central controller that:
 - Provides system-wide status and control
 """
 
-from threading import RLock, Thread, Event
-from typing import List, Dict, Optional
-from queue import Queue
+from threading import Lock, Thread, Event, current_thread
+from typing import Iterable, List, Dict, Optional, Tuple
+from collections import deque
+from queue import Empty, SimpleQueue
+import asyncio
 import time
 
 from elevator_system.models import Request, Direction, ElevatorState
@@ -51,23 +53,41 @@ class ElevatorController:
         if not elevators:
             raise ValueError("At least one elevator is required")
         
-        self._elevators = list(elevators)
+        # The fleet is immutable after construction, so it is read without
+        # holding self._lock
+        self._elevators: Tuple[Elevator, ...] = tuple(elevators)
+        self._elevators_by_id: Dict[int, Elevator] = {}
+        for elevator in self._elevators:
+            # First elevator wins on duplicate IDs, as with a linear scan
+            self._elevators_by_id.setdefault(elevator.id, elevator)
+        # Bound step methods, so the per-tick loop skips attribute lookups
+        self._elevator_steps = tuple(e.step for e in self._elevators)
         self._dispatch_strategy = dispatch_strategy or LookDispatchStrategy()
         self._step_interval = step_interval_seconds
         
-        # Request queue for pending requests that couldn't be assigned
-        self._pending_requests: Queue[Request] = Queue()
+        # Pending requests that couldn't be assigned (guarded by self._lock)
+        self._pending_requests: deque[Request] = deque()
+        
+        # Requests submitted via submit_request(), dispatched on the next step
+        self._incoming: SimpleQueue[Request] = SimpleQueue()
+        
+        # Thread safety: serializes strategy swaps and guards the pending
+        # queue. Elevators carry their own locks, so stepping and dispatch
+        # do not take this one.
+        self._lock = Lock()
         
-        # Thread safety
-        self._lock = RLock()
-        self._running = False
+        # Simulation lifecycle: each run gets a fresh stop event, which is the
+        # single source of truth and is set once that run stops. The lifecycle
+        # lock only serializes starting a run, never request traffic.
         self._stop_event = Event()
+        self._stop_event.set()
+        self._lifecycle_lock = Lock()
         self._simulation_thread: Optional[Thread] = None
     
     @property
-    def elevators(self) -> List[Elevator]:
-        """Get list of managed elevators."""
-        return list(self._elevators)
+    def elevators(self) -> Tuple[Elevator, ...]:
+        """Get the managed elevators (an immutable tuple, so no copy is made)."""
+        return self._elevators
     
     def set_dispatch_strategy(self, strategy: DispatchStrategy) -> None:
         """
@@ -80,13 +100,23 @@ class ElevatorController:
     
     def add_observer_to_all(self, observer: ElevatorObserver) -> None:
         """Add an observer to all elevators."""
+        self.add_observers_to_all((observer,))
+    
+    def add_observers_to_all(self, observers: Iterable[ElevatorObserver]) -> None:
+        """Add several observers to all elevators, one bulk call per elevator."""
+        observers = tuple(observers)
         for elevator in self._elevators:
-            elevator.add_observer(observer)
+            elevator.add_observers(observers)
     
     def remove_observer_from_all(self, observer: ElevatorObserver) -> None:
         """Remove an observer from all elevators."""
+        self.remove_observers_from_all((observer,))
+    
+    def remove_observers_from_all(self, observers: Iterable[ElevatorObserver]) -> None:
+        """Remove several observers from all elevators, one bulk call per elevator."""
+        observers = tuple(observers)
         for elevator in self._elevators:
-            elevator.remove_observer(observer)
+            elevator.remove_observers(observers)
     
     def request_elevator(
         self,
@@ -119,80 +149,150 @@ class ElevatorController:
         self._dispatch_request(request)
         return request
     
+    def submit_request(
+        self,
+        from_floor: int,
+        to_floor: int,
+        passengers: int = 1,
+    ) -> Request:
+        """
+        Queue a request for dispatch on the next simulation step.
+        
+        Unlike request_elevator(), the caller never runs the dispatch
+        strategy or waits on any lock: the request is handed to the
+        simulation thread, which assigns it at the start of step().
+        
+        Args:
+            from_floor: Pickup floor
+            to_floor: Destination floor
+            passengers: Number of passengers
+            
+        Returns:
+            The created Request object
+            
+        Raises:
+            ValueError: If floors are invalid or equal
+        """
+        request = Request(
+            pickup_floor=from_floor,
+            destination_floor=to_floor,
+            passengers=passengers,
+        )
+        
+        self._incoming.put_nowait(request)
+        return request
+    
     def _dispatch_request(self, request: Request) -> bool:
         """
         Dispatch a request to the best available elevator.
         
+        The controller lock is only taken to queue the request; selection
+        and assignment rely on each elevator's own lock.
+        
         Returns True if request was assigned, False if queued.
         """
+        strategy = self._dispatch_strategy  # Single reference read, atomic
+        
+        elevator = strategy.select_elevator(request, self._elevators)
+        if elevator is not None and elevator.add_request(request):
+            return True
+        
+        # No suitable elevator, queue the request
         with self._lock:
-            elevator = self._dispatch_strategy.select_elevator(
-                request, self._elevators
-            )
-            
-            if elevator and elevator.add_request(request):
-                return True
-            
-            # No suitable elevator, queue the request
-            self._pending_requests.put(request)
-            return False
+            self._pending_requests.append(request)
+        return False
+    
+    def _drain_incoming_requests(self) -> None:
+        """Dispatch every request submitted since the last step."""
+        incoming = self._incoming
+        while True:
+            try:
+                request = incoming.get_nowait()
+            except Empty:
+                return
+            self._dispatch_request(request)
     
     def _process_pending_requests(self) -> None:
         """Try to dispatch any pending requests."""
         with self._lock:
-            retry_queue: List[Request] = []
-            
-            while not self._pending_requests.empty():
-                try:
-                    request = self._pending_requests.get_nowait()
-                    elevator = self._dispatch_strategy.select_elevator(
-                        request, self._elevators
-                    )
-                    
-                    if elevator and elevator.add_request(request):
-                        continue  # Successfully dispatched
-                    
-                    retry_queue.append(request)
-                except Exception:
-                    break
-            
-            # Re-queue failed requests
-            for request in retry_queue:
-                self._pending_requests.put(request)
+            strategy = self._dispatch_strategy
+            batch = list(self._pending_requests)
+            self._pending_requests.clear()
+        
+        assignments = strategy.select_elevators_batch(batch, self._elevators)
+        retry_queue = [
+            request
+            for request, elevator in zip(batch, assignments)
+            if elevator is None or not elevator.add_request(request)
+        ]
+        
+        # Re-queue failed requests
+        if retry_queue:
+            with self._lock:
+                self._pending_requests.extend(retry_queue)
     
     def step(self) -> None:
         """
         Process one simulation step for all elevators.
         
-        This advances each elevator by one time unit.
+        This advances each elevator by one time unit. Elevators are
+        stepped outside the controller lock; each one serializes its own
+        state changes, so request submission never waits on the fleet.
         """
-        with self._lock:
-            # First, try to dispatch pending requests
+        # Assign requests handed over by submit_request()
+        if not self._incoming.empty():
+            self._drain_incoming_requests()
+        
+        # Then, try to dispatch pending requests. The unlocked emptiness
+        # check is a single atomic read; a request queued just after it is
+        # picked up on the next step.
+        if self._pending_requests:
             self._process_pending_requests()
-            
-            # Step each elevator
-            for elevator in self._elevators:
-                elevator.step()
+        
+        # Step each elevator (the fleet is fixed after __init__)
+        for step_elevator in self._elevator_steps:
+            step_elevator()
     
     def start(self) -> None:
         """
         Start the elevator simulation in a background thread.
         
-        The simulation runs until stop() is called.
+        The simulation runs until stop() is called. Calling start() while
+        it is already running is a no-op.
         """
-        with self._lock:
-            if self._running:
+        if self.is_running():
+            return
+        
+        with self._lifecycle_lock:
+            if self.is_running():
                 return
             
-            self._running = True
-            self._stop_event.clear()
+            self._join_previous_loop_locked()
+            
+            self._stop_event = Event()
             self._simulation_thread = Thread(
                 target=self._simulation_loop,
+                args=(self._stop_event,),
                 daemon=True,
                 name="ElevatorSimulation"
             )
             self._simulation_thread.start()
     
+    def _join_previous_loop_locked(self) -> None:
+        """
+        Wait for a stopped simulation thread that is still winding down.
+        
+        stop() may return before the thread exits; letting it finish first
+        means two loops never run at once. Caller must hold _lifecycle_lock.
+        """
+        previous = self._simulation_thread
+        if (
+            previous is not None
+            and previous.is_alive()
+            and previous is not current_thread()
+        ):
+            previous.join()
+    
     def stop(self, timeout: float = 5.0) -> None:
         """
         Stop the elevator simulation.
@@ -200,62 +300,135 @@ class ElevatorController:
         Args:
             timeout: Maximum time to wait for simulation to stop
         """
-        with self._lock:
-            if not self._running:
-                return
-            
-            self._running = False
-            self._stop_event.set()
+        self._stop_event.set()
         
-        if self._simulation_thread:
-            self._simulation_thread.join(timeout=timeout)
+        thread = self._simulation_thread
+        if thread is not None and thread is not current_thread():
+            thread.join(timeout=timeout)
     
-    def _simulation_loop(self) -> None:
-        """Main simulation loop - runs in background thread."""
-        while not self._stop_event.is_set():
-            self.step()
-            time.sleep(self._step_interval)
+    def _simulation_loop(self, stop_event: Event) -> None:
+        """
+        Main simulation loop - runs in background thread.
+        
+        Ticks are scheduled against fixed monotonic deadlines so the time
+        spent in step() doesn't accumulate as drift, and waiting on the
+        stop event lets stop() wake the loop immediately.
+        """
+        try:
+            next_tick = time.monotonic()
+            while not stop_event.is_set():
+                self.step()
+                next_tick += self._step_interval
+                delay = next_tick - time.monotonic()
+                if delay > 0 and stop_event.wait(delay):
+                    break
+        finally:
+            # Also covers step() raising: the system no longer reports running
+            stop_event.set()
+    
+    async def run_async(self) -> None:
+        """
+        Run the simulation as a coroutine on the current event loop.
+        
+        An alternative to start() for callers that already have an event
+        loop: no simulation thread is created, and observers can schedule
+        async work on the same loop. Returns once stop() is called, at the
+        latest one step interval later. If a stopped start() thread is
+        still finishing its last step, this waits for it first.
+        
+        Raises:
+            RuntimeError: If the simulation is already running
+        """
+        with self._lifecycle_lock:
+            if self.is_running():
+                raise RuntimeError("Simulation is already running")
+            self._join_previous_loop_locked()
+            stop_event = self._stop_event = Event()
+        
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        try:
+            while not stop_event.is_set():
+                self.step()
+                next_tick += self._step_interval
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        finally:
+            stop_event.set()
     
     def is_running(self) -> bool:
         """Check if simulation is running."""
-        return self._running
+        return not self._stop_event.is_set()
+    
+    def pending_count(self) -> int:
+        """Number of requests waiting to be assigned to an elevator."""
+        return len(self._pending_requests) + self._incoming.qsize()
+    
+    def idle_count(self) -> int:
+        """Number of elevators with no pending work."""
+        return sum(1 for e in self._elevators if e.is_idle)
+    
+    def total_load(self) -> int:
+        """Total passengers currently inside all elevators."""
+        return sum(e.current_load for e in self._elevators)
     
-    def get_system_status(self) -> Dict:
+    def get_system_status(self, include_elevators: bool = True) -> Dict:
         """
         Get the current status of all elevators.
         
+        Lock-free: the result is a point-in-time snapshot, and each
+        elevator's get_state() is internally consistent on its own.
+        Callers that poll only for summary numbers should pass
+        include_elevators=False (or use pending_count(), idle_count() and
+        total_load()), which skips the per-elevator state snapshots.
+        
+        Args:
+            include_elevators: Whether to include the per-elevator "elevators" list
+        
         Returns:
             Dictionary with system-wide status information
         """
-        with self._lock:
-            states = [e.get_state() for e in self._elevators]
-            
-            return {
-                "running": self._running,
-                "pending_requests": self._pending_requests.qsize(),
-                "total_elevators": len(self._elevators),
-                "idle_elevators": sum(1 for s in states if s.is_idle),
-                "total_load": sum(s.current_load for s in states),
-                "total_capacity": sum(s.capacity for s in states),
-                "elevators": [
-                    {
-                        "id": s.elevator_id,
-                        "floor": s.current_floor,
-                        "direction": s.direction.name,
-                        "load": s.current_load,
-                        "capacity": s.capacity,
-                        "pending_stops": s.total_pending_stops,
-                    }
-                    for s in states
-                ],
-            }
+        elevators = self._elevators
+        status = {
+            "running": self.is_running(),
+            "pending_requests": self.pending_count(),
+            "total_elevators": len(elevators),
+        }
+        
+        if not include_elevators:
+            status["idle_elevators"] = self.idle_count()
+            status["total_load"] = self.total_load()
+            status["total_capacity"] = sum(e.capacity for e in elevators)
+            return status
+        
+        idle_elevators = 0
+        total_load = 0
+        total_capacity = 0
+        elevator_status = []
+        
+        for elevator in elevators:
+            s = elevator.get_state()
+            if s.is_idle:
+                idle_elevators += 1
+            total_load += s.current_load
+            total_capacity += s.capacity
+            elevator_status.append({
+                "id": s.elevator_id,
+                "floor": s.current_floor,
+                "direction": s.direction.name,
+                "load": s.current_load,
+                "capacity": s.capacity,
+                "pending_stops": s.total_pending_stops,
+            })
+        
+        status["idle_elevators"] = idle_elevators
+        status["total_load"] = total_load
+        status["total_capacity"] = total_capacity
+        status["elevators"] = elevator_status
+        return status
     
     def get_elevator(self, elevator_id: int) -> Optional[Elevator]:
         """Get an elevator by ID."""
-        for elevator in self._elevators:
-            if elevator.id == elevator_id:
-                return elevator
-        return None
+        return self._elevators_by_id.get(elevator_id)
     
     def __enter__(self) -> "ElevatorController":
         """Context manager entry - starts the simulation."""
@@ -8,9 +8,12 @@ This module contains the core Elevator class that manages:
 - Thread-safe concurrent access
 """
 
-from threading import RLock
-from typing import List, Optional, Dict, Set
-from sortedcontainers import SortedSet  # type: ignore
+from bisect import bisect_right
+from collections import deque
+from operator import itemgetter
+from threading import Lock, RLock
+from time import monotonic
+from typing import Any, Callable, Deque, FrozenSet, Iterable, List, NamedTuple, Optional, Dict, Tuple
 
 from elevator_system.models import (
     Direction,
@@ -18,23 +21,54 @@ from elevator_system.models import (
     Request,
     ElevatorState,
 )
-from elevator_system.observers import ElevatorObserver
+from elevator_system.observers import (
+    EVENT_LEVELS,
+    CompositeObserver,
+    ElevatorEvent,
+    ElevatorObserver,
+    notify_level_of,
+    overrides_batch,
+    overrides_event,
+)
+
+
+# (notify level, bound on_events for batch observers, bound on_* method per
+# handled event name, a CompositeObserver's live per-event children lookup)
+_ObserverEntry = Tuple[
+    int,
+    Optional[Callable[[List[ElevatorEvent]], None]],
+    Dict[str, Callable[..., None]],
+    Optional[Callable[[str], Iterable[Callable[..., None]]]],
+]
+
+
+class _Subscription(NamedTuple):
+    """Registration key for a callback added with Elevator.subscribe()."""
+    event: str
+    callback: Callable[..., None]
 
 
 class Elevator:
     """
     Thread-safe elevator that processes requests using LOOK algorithm.
     
-    The elevator maintains two sorted sets of stops:
-    - _up_stops: Floors to visit when going UP
-    - _down_stops: Floors to visit when going DOWN
+    The elevator maintains two bitmasks of stops, bit i standing for
+    floor min_floor + i:
+    - _up_mask: Floors to visit when going UP
+    - _down_mask: Floors to visit when going DOWN
     
     It serves all requests in the current direction before reversing,
     which minimizes direction changes and optimizes travel time.
     
     Thread Safety:
         All public methods acquire the internal lock before modifying state.
-        The lock is reentrant (RLock) to allow nested calls safely.
+        Every change publishes a new immutable ElevatorState, which
+        get_state() returns without taking the lock.
+        The lock is not reentrant: methods that run with it held use the
+        *_locked helpers instead of calling public methods. Events raised
+        under the lock are queued in order and delivered after it is
+        released, so observers may call back into the elevator. Deliveries
+        for one elevator run one at a time, in the order the events happened.
     """
     
     def __init__(
@@ -76,16 +110,42 @@ class Elevator:
         self._door_state = DoorState.CLOSED
         self._current_load = 0
         
-        # Request tracking - maps floor to requests for that floor
-        self._up_stops: SortedSet = SortedSet()  # Floors to visit going up
-        self._down_stops: SortedSet = SortedSet()  # Floors to visit going down
-        self._active_requests: Dict[int, Set[Request]] = {}  # floor -> requests
+        # Stops as bitmasks: bit i set means floor min_floor + i is a stop
+        self._up_mask = 0  # Floors to visit going up
+        self._down_mask = 0  # Floors to visit going down
+        # Request tracking - maps floor to requests for that floor: waiting
+        # to board there / riding to it, indexed by floor - min_floor
+        floor_count = max_floor - min_floor + 1
+        self._requests_by_pickup: List[List[Request]] = [[] for _ in range(floor_count)]
+        self._requests_by_destination: List[List[Request]] = [[] for _ in range(floor_count)]
+        # (mask, frozen floors) per direction; the mask doubles as the version,
+        # so a view is rebuilt only when that direction's stops really change
+        self._up_view: Tuple[int, FrozenSet[int]] = (0, frozenset())
+        self._down_view: Tuple[int, FrozenSet[int]] = (0, frozenset())
         
         # Thread safety
-        self._lock = RLock()
+        self._lock = Lock()
         
         # Observers
-        self._observers: List[ElevatorObserver] = []
+        # Copy-on-write tuples sorted by notify level; replaced under the lock,
+        # read without it. _observer_entries is parallel to _observers, which
+        # holds observers and the _Subscription keys of subscribe().
+        self._observers: Tuple[Any, ...] = ()
+        self._observer_entries: Tuple[_ObserverEntry, ...] = ()
+        # Events at least one observer handles; others are not even built
+        self._handled_events: FrozenSet[str] = frozenset()
+        # Events raised under the lock, delivered once it is released
+        self._event_buffer: List[ElevatorEvent] = []
+        self._in_step = False
+        self._step_time: Optional[float] = None  # Shared by one step's events
+        # Batches waiting for delivery, appended under the lock so they stay in
+        # the order the events happened; drained by whoever holds the
+        # delivery lock (reentrant so observers can trigger nested deliveries)
+        self._outbox: Deque[List[ElevatorEvent]] = deque()
+        self._delivery_lock = RLock()
+        
+        # Latest published state; rebound (never mutated) under the lock
+        self._snapshot = self._build_state_locked()
     
     @property
     def id(self) -> int:
@@ -97,56 +157,188 @@ class Elevator:
         """Get elevator capacity."""
         return self._capacity
     
+    @property
+    def current_load(self) -> int:
+        """Get the number of passengers currently inside."""
+        return self._current_load
+    
+    @property
+    def is_idle(self) -> bool:
+        """Check if elevator has no pending work, from the published state."""
+        return self._snapshot.is_idle
+    
     def add_observer(self, observer: ElevatorObserver) -> None:
         """Add an observer to receive elevator events."""
         with self._lock:
-            if observer not in self._observers:
-                self._observers.append(observer)
+            self._add_observer_locked(observer)
+    
+    def add_observers(self, observers: Iterable[ElevatorObserver]) -> None:
+        """Add several observers at once, taking the lock a single time."""
+        with self._lock:
+            for observer in observers:
+                self._add_observer_locked(observer)
     
     def remove_observer(self, observer: ElevatorObserver) -> None:
         """Remove an observer."""
         with self._lock:
-            if observer in self._observers:
-                self._observers.remove(observer)
+            self._remove_observer_locked(observer)
+    
+    def remove_observers(self, observers: Iterable[ElevatorObserver]) -> None:
+        """Remove several observers at once, taking the lock a single time."""
+        with self._lock:
+            for observer in observers:
+                self._remove_observer_locked(observer)
+    
+    def set_observers(self, observers: Iterable[ElevatorObserver]) -> None:
+        """
+        Replace all registered observers in one go.
+        
+        Callbacks added with subscribe() are kept.
+        """
+        with self._lock:
+            for key in self._observers:
+                if not isinstance(key, _Subscription):
+                    self._remove_observer_locked(key)
+            for observer in observers:
+                self._add_observer_locked(observer)
+    
+    def subscribe(self, event: str, callback: Callable[..., None]) -> None:
+        """
+        Call a function for one event, without writing an observer class.
+        
+        The callback gets the same arguments as the matching
+        ElevatorObserver method, e.g. (state, floor) for "on_floor_reached".
+        
+        Raises:
+            ValueError: If the event name is unknown
+        """
+        if event not in EVENT_LEVELS:
+            raise ValueError(f"Unknown event: {event!r}")
+        with self._lock:
+            self._insert_locked(
+                _Subscription(event, callback),
+                (EVENT_LEVELS[event], None, {event: callback}, None),
+            )
+    
+    def unsubscribe(self, event: str, callback: Callable[..., None]) -> None:
+        """Stop calling a function registered with subscribe()."""
+        with self._lock:
+            self._remove_observer_locked(_Subscription(event, callback))
+    
+    def _add_observer_locked(self, observer: ElevatorObserver) -> None:
+        """Insert an observer, keeping the tuples ordered by notify level."""
+        if observer not in self._observers:
+            self._insert_locked(observer, self._make_entry(observer))
+    
+    def _insert_locked(self, key: Any, entry: _ObserverEntry) -> None:
+        """Insert a registration at its level's position, unless already present."""
+        if key in self._observers:
+            return
+        index = bisect_right(self._observer_entries, entry[0], key=itemgetter(0))
+        self._observers = self._observers[:index] + (key,) + self._observers[index:]
+        self._observer_entries = (
+            self._observer_entries[:index] + (entry,) + self._observer_entries[index:]
+        )
+        self._refresh_handled_events()
+    
+    def _remove_observer_locked(self, observer: Any) -> None:
+        """Remove an observer (or subscribe() key) and its entry."""
+        if observer in self._observers:
+            index = self._observers.index(observer)
+            self._observers = self._observers[:index] + self._observers[index + 1:]
+            self._observer_entries = (
+                self._observer_entries[:index] + self._observer_entries[index + 1:]
+            )
+            self._refresh_handled_events()
+    
+    def _refresh_handled_events(self) -> None:
+        """Recompute which events any registered observer wants."""
+        handled = set()
+        for level, on_events, handlers, children in self._observer_entries:
+            if on_events is not None or children is not None:
+                handled.update(
+                    name for name, event_level in EVENT_LEVELS.items() if event_level >= level
+                )
+            else:
+                handled.update(handlers)
+        self._handled_events = frozenset(handled)
+    
+    @staticmethod
+    def _make_entry(observer: ElevatorObserver) -> _ObserverEntry:
+        """Look up an observer's level and callbacks once, at registration time."""
+        level = notify_level_of(observer)
+        if overrides_batch(observer):
+            return level, observer.on_events, {}, None
+        if type(observer) is CompositeObserver:
+            # Call the children directly; the lookup is live, so children
+            # added to or removed from the composite later are picked up.
+            # Subclasses may override on_* and go through the normal path.
+            return level, None, {}, observer.callbacks_for
+        # Only events the observer overrides, at or above its level
+        return level, None, {
+            name: getattr(observer, name)
+            for name, event_level in EVENT_LEVELS.items()
+            if event_level >= level and overrides_event(observer, name)
+        }, None
     
     def get_state(self) -> ElevatorState:
         """
         Get a snapshot of the current elevator state.
         
+        The snapshot is immutable and shared between callers; reading it
+        takes no lock.
+        
         Returns:
             ElevatorState with current floor, direction, load, etc.
         """
-        with self._lock:
-            return ElevatorState(
-                elevator_id=self._id,
-                current_floor=self._current_floor,
-                direction=self._direction,
-                door_state=self._door_state,
-                current_load=self._current_load,
-                capacity=self._capacity,
-                pending_stops_up=frozenset(self._up_stops),
-                pending_stops_down=frozenset(self._down_stops),
-            )
+        return self._snapshot
+    
+    def _build_state_locked(self, observed_at: Optional[float] = None) -> ElevatorState:
+        """Build a state snapshot. Caller must hold the lock."""
+        if self._up_view[0] != self._up_mask:
+            self._up_view = (self._up_mask, self._floors_in(self._up_mask))
+        if self._down_view[0] != self._down_mask:
+            self._down_view = (self._down_mask, self._floors_in(self._down_mask))
+        return ElevatorState(
+            elevator_id=self._id,
+            current_floor=self._current_floor,
+            direction=self._direction,
+            door_state=self._door_state,
+            current_load=self._current_load,
+            capacity=self._capacity,
+            pending_stops_up=self._up_view[1],
+            pending_stops_down=self._down_view[1],
+            observed_at=observed_at,
+        )
+    
+    def _floors_in(self, mask: int) -> FrozenSet[int]:
+        """Convert a stop bitmask back into floor numbers."""
+        floors = []
+        while mask:
+            low_bit = mask & -mask
+            floors.append(self._min_floor + low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return frozenset(floors)
     
     def can_accept_request(self, request: Request) -> bool:
         """
         Check if this elevator can accept a new request.
         
-        Validates floor bounds and capacity constraints.
+        Validates floor bounds and capacity constraints. Only reads
+        configuration fixed at construction, so no lock is needed.
         """
-        with self._lock:
-            # Check floor bounds
-            if not (self._min_floor <= request.pickup_floor <= self._max_floor):
-                return False
-            if not (self._min_floor <= request.destination_floor <= self._max_floor):
-                return False
-            
-            # Check if we can fit the passengers
-            # Note: We do a simplified check - real systems would be more sophisticated
-            if request.passengers > self._capacity:
-                return False
-            
-            return True
+        # Check floor bounds
+        if not (self._min_floor <= request.pickup_floor <= self._max_floor):
+            return False
+        if not (self._min_floor <= request.destination_floor <= self._max_floor):
+            return False
+        
+        # Check if we can fit the passengers
+        # Note: We do a simplified check - real systems would be more sophisticated
+        if request.passengers > self._capacity:
+            return False
+        
+        return True
     
     def add_request(self, request: Request) -> bool:
         """
@@ -170,24 +362,18 @@ class Elevator:
             request_direction = request.direction
             
             # Track the request
-            if pickup not in self._active_requests:
-                self._active_requests[pickup] = set()
-            self._active_requests[pickup].add(request)
-            
-            if destination not in self._active_requests:
-                self._active_requests[destination] = set()
-            self._active_requests[destination].add(request)
+            self._requests_by_pickup[pickup - self._min_floor].append(request)
+            self._requests_by_destination[destination - self._min_floor].append(request)
             
             # Add stops based on request direction
-            if request_direction == Direction.UP:
-                self._up_stops.add(pickup)
-                self._up_stops.add(destination)
+            bits = (1 << (pickup - self._min_floor)) | (1 << (destination - self._min_floor))
+            if request_direction is Direction.UP:
+                self._up_mask |= bits
             else:
-                self._down_stops.add(pickup)
-                self._down_stops.add(destination)
+                self._down_mask |= bits
             
             # If idle, set initial direction based on request
-            if self._direction == Direction.IDLE:
+            if self._direction is Direction.IDLE:
                 if pickup > self._current_floor:
                     self._direction = Direction.UP
                 elif pickup < self._current_floor:
@@ -196,8 +382,12 @@ class Elevator:
                     # Pickup is at current floor
                     self._direction = request_direction
             
+            self._snapshot = self._build_state_locked()
             self._notify_request_accepted(request)
-            return True
+            self._post_events_locked()
+        
+        self._flush_outbox()
+        return True
     
     def step(self) -> None:
         """
@@ -211,116 +401,166 @@ class Elevator:
         5. Updates direction if needed
         """
         with self._lock:
-            if self._direction == Direction.IDLE:
+            if self._direction is Direction.IDLE:
                 return
+            try:
+                self._step_locked()
+            finally:
+                self._post_events_locked()
+        
+        self._flush_outbox()
+    
+    def run_until_idle(self, max_steps: int) -> List[int]:
+        """
+        Step until the elevator is idle, taking the lock a single time.
+        
+        Observers get each step's events as a separate batch, as with
+        step(), once the run is over and the lock is released.
+        
+        Args:
+            max_steps: Upper bound on the number of steps taken
             
-            # Check if current floor is a stop
-            if self._is_current_floor_a_stop():
-                self._process_current_floor()
+        Returns:
+            The floor the elevator is on after each step taken
+        """
+        floors: List[int] = []
+        with self._lock:
+            for _ in range(max_steps):
+                if self._direction is Direction.IDLE:
+                    break
+                try:
+                    self._step_locked()
+                finally:
+                    self._post_events_locked()
+                floors.append(self._current_floor)
+        
+        self._flush_outbox()
+        return floors
+    
+    def _step_locked(self) -> None:
+        """One step of a non-idle elevator. Caller must hold the lock."""
+        self._in_step = True
+        try:
+            # Serve the current floor if it is a stop
+            self._arrive_if_stop()
             
             # Move if we have more stops
             if self._has_pending_stops():
-                self._move()
-                self._notify_floor_reached(self._current_floor)
+                self._notify_floor_reached(self._move())
                 
-                # Check new floor for stops
-                if self._is_current_floor_a_stop():
-                    self._process_current_floor()
+                # Serve the new floor if it is a stop
+                self._arrive_if_stop()
             
             # Update direction for next step
             self._update_direction()
+        finally:
+            self._in_step = False
+            self._step_time = None
+            self._snapshot = self._build_state_locked()
     
-    def _is_current_floor_a_stop(self) -> bool:
-        """Check if elevator needs to stop at current floor."""
-        floor = self._current_floor
-        if self._direction == Direction.UP:
-            return floor in self._up_stops
-        elif self._direction == Direction.DOWN:
-            return floor in self._down_stops
-        return floor in self._up_stops or floor in self._down_stops
-    
-    def _process_current_floor(self) -> None:
-        """Handle arrival at a stop floor - open doors, process passengers."""
+    def _post_events_locked(self) -> None:
+        """Queue the buffered events as one batch. Caller must hold the lock."""
+        if self._event_buffer:
+            self._outbox.append(self._event_buffer)
+            self._event_buffer = []
+    
+    def _arrive_if_stop(self) -> None:
+        """Process the current floor if it is a stop in the current direction."""
+        bit = 1 << (self._current_floor - self._min_floor)
+        if self._direction is Direction.UP:
+            if self._up_mask & bit:
+                self._process_current_floor(bit)
+        elif self._direction is Direction.DOWN:
+            if self._down_mask & bit:
+                self._process_current_floor(bit)
+    
+    def _process_current_floor(self, bit: int) -> None:
+        """
+        Handle arrival at a stop floor - open doors, process passengers.
+        
+        Args:
+            bit: The current floor's bit, already known to be set in the
+                mask for the current direction
+        """
         floor = self._current_floor
         
         # Open doors
         self._door_state = DoorState.OPEN
         self._notify_door_opened()
         
-        # Remove floor from appropriate stop list
-        if self._direction == Direction.UP and floor in self._up_stops:
-            self._up_stops.remove(floor)
-        elif self._direction == Direction.DOWN and floor in self._down_stops:
-            self._down_stops.remove(floor)
+        # Remove floor from the current direction's stops
+        if self._direction is Direction.UP:
+            self._up_mask &= ~bit
+        else:
+            self._down_mask &= ~bit
         
-        # Process completed requests at this floor
-        if floor in self._active_requests:
-            completed = []
-            for request in self._active_requests[floor]:
-                if request.destination_floor == floor:
-                    # Passenger exiting
-                    self._current_load = max(0, self._current_load - request.passengers)
-                    completed.append(request)
-                    self._notify_request_completed(request)
-                elif request.pickup_floor == floor:
-                    # Passenger entering
-                    if self._current_load + request.passengers <= self._capacity:
-                        self._current_load += request.passengers
-            
-            # Clean up completed requests
-            for request in completed:
-                self._active_requests[floor].discard(request)
-                # Also remove from pickup floor if different
-                if request.pickup_floor in self._active_requests:
-                    self._active_requests[request.pickup_floor].discard(request)
-            
-            if not self._active_requests[floor]:
-                del self._active_requests[floor]
+        # Passengers exiting at this floor
+        index = floor - self._min_floor
+        arriving = self._requests_by_destination[index]
+        if arriving:
+            for request in arriving:
+                self._current_load = max(0, self._current_load - request.passengers)
+                # Drop it from its pickup floor if it never boarded
+                waiting = self._requests_by_pickup[request.pickup_floor - self._min_floor]
+                if request in waiting:
+                    waiting.remove(request)
+                self._notify_request_completed(request)
+            arriving.clear()
+        
+        # Passengers entering; those that don't fit keep waiting
+        boarding = self._requests_by_pickup[index]
+        if boarding:
+            left_behind = []
+            for request in boarding:
+                if self._current_load + request.passengers <= self._capacity:
+                    self._current_load += request.passengers
+                else:
+                    left_behind.append(request)
+            self._requests_by_pickup[index] = left_behind
         
         # Close doors
         self._door_state = DoorState.CLOSED
         self._notify_door_closed()
     
-    def _move(self) -> None:
-        """Move one floor in current direction."""
-        if self._direction == Direction.UP:
+    def _move(self) -> int:
+        """Move one floor in current direction and return the new floor."""
+        if self._direction is Direction.UP:
             if self._current_floor < self._max_floor:
                 self._current_floor += 1
-        elif self._direction == Direction.DOWN:
+        elif self._direction is Direction.DOWN:
             if self._current_floor > self._min_floor:
                 self._current_floor -= 1
+        return self._current_floor
     
     def _has_pending_stops(self) -> bool:
         """Check if there are any pending stops."""
-        return len(self._up_stops) > 0 or len(self._down_stops) > 0
+        return bool(self._up_mask | self._down_mask)
     
     def _update_direction(self) -> None:
         """Update direction based on pending stops."""
-        if self._direction == Direction.UP:
+        if self._direction is Direction.UP:
             # Check if there are more stops above
-            higher_stops = [f for f in self._up_stops if f > self._current_floor]
-            if higher_stops:
+            if self._up_mask >> (self._current_floor - self._min_floor + 1):
                 return  # Continue going up
             
             # No more stops above, check if we need to go down
-            if self._down_stops:
+            if self._down_mask:
                 self._direction = Direction.DOWN
-            elif self._up_stops:
+            elif self._up_mask:
                 # There are up stops below us (picked up along the way)
                 self._direction = Direction.DOWN
             else:
                 self._direction = Direction.IDLE
                 
-        elif self._direction == Direction.DOWN:
+        elif self._direction is Direction.DOWN:
             # Check if there are more stops below
-            lower_stops = [f for f in self._down_stops if f < self._current_floor]
-            if lower_stops:
+            if self._down_mask & ((1 << (self._current_floor - self._min_floor)) - 1):
                 return  # Continue going down
             
             # No more stops below, check if we need to go up
-            if self._up_stops:
+            if self._up_mask:
                 self._direction = Direction.UP
-            elif self._down_stops:
+            elif self._down_mask:
                 # There are down stops above us
                 self._direction = Direction.UP
             else:
@@ -328,55 +568,103 @@ class Elevator:
     
     def _notify_floor_reached(self, floor: int) -> None:
         """Notify observers of floor arrival."""
-        state = self.get_state()
-        for observer in self._observers:
-            try:
-                observer.on_floor_reached(state, floor)
-            except Exception:
-                pass  # Don't let observer errors affect elevator
+        self._emit("on_floor_reached", floor)
     
     def _notify_door_opened(self) -> None:
         """Notify observers of door opening."""
-        state = self.get_state()
-        for observer in self._observers:
-            try:
-                observer.on_door_opened(state)
-            except Exception:
-                pass
+        self._emit("on_door_opened")
     
     def _notify_door_closed(self) -> None:
         """Notify observers of door closing."""
-        state = self.get_state()
-        for observer in self._observers:
-            try:
-                observer.on_door_closed(state)
-            except Exception:
-                pass
+        self._emit("on_door_closed")
     
     def _notify_request_accepted(self, request: Request) -> None:
         """Notify observers of request acceptance."""
-        state = self.get_state()
-        for observer in self._observers:
-            try:
-                observer.on_request_accepted(state, request)
-            except Exception:
-                pass
+        self._emit("on_request_accepted", request)
     
     def _notify_request_completed(self, request: Request) -> None:
         """Notify observers of request completion."""
-        state = self.get_state()
-        for observer in self._observers:
-            try:
-                observer.on_request_completed(state, request)
-            except Exception:
-                pass
+        self._emit("on_request_completed", request)
+    
+    def _emit(self, name: str, *payload: Any) -> None:
+        """
+        Buffer an event with the current state, for delivery after the lock
+        is released. Events raised in one step share the step's time.
+        """
+        if name not in self._handled_events:
+            return  # Nobody listens for this event
+        if self._in_step:
+            # One clock read per step, shared by every event it raises
+            if self._step_time is None:
+                self._step_time = monotonic()
+            state = self._build_state_locked(self._step_time)
+        else:
+            state = self._build_state_locked()
+        self._event_buffer.append((name, (state, *payload)))
+    
+    def _flush_outbox(self) -> None:
+        """
+        Deliver queued batches, oldest first. Called without the elevator lock.
+        
+        A batch queued by another thread may be delivered here, and ours may
+        be delivered by whichever thread holds the delivery lock; either
+        way batches go out in the order they were queued.
+        """
+        if not self._outbox:
+            return
+        with self._delivery_lock:
+            while self._outbox:
+                self._deliver_batch(self._outbox.popleft())
+    
+    def _deliver_batch(self, events: List[ElevatorEvent]) -> None:
+        """
+        Hand a batch of events to every observer that listens at their level.
+        
+        Caller must hold the delivery lock; the batch is never empty.
+        """
+        levels = [EVENT_LEVELS[name] for name, _ in events]
+        lowest, highest = min(levels), max(levels)
+        for level, on_events, handlers, children in self._observer_entries:
+            if level > highest:
+                break  # Remaining observers only want higher-level events
+            if level > lowest:
+                events = [e for e, e_level in zip(events, levels) if e_level >= level]
+                levels = [e_level for e_level in levels if e_level >= level]
+                lowest = min(levels)
+            if on_events is not None:
+                try:
+                    on_events(events)
+                except Exception:
+                    pass  # Don't let observer errors affect elevator
+                continue
+            if children is not None:
+                # A composite's children, flattened into this loop. As with
+                # the composite's own on_* methods, a failing child skips the
+                # rest of that event's children.
+                for name, args in events:
+                    try:
+                        for callback in children(name):
+                            callback(*args)
+                    except Exception:
+                        pass
+                continue
+            # Observers without a batch handler get one call per handled event
+            for name, args in events:
+                handler = handlers.get(name)
+                if handler is None:
+                    continue
+                try:
+                    handler(*args)
+                except Exception:
+                    pass
     
     def __repr__(self) -> str:
-        with self._lock:
-            return (
-                f"Elevator(id={self._id}, floor={self._current_floor}, "
-                f"direction={self._direction.name}, load={self._current_load}/{self._capacity})"
-            )
+        # From the published state, so observers can repr() without the lock
+        state = self._snapshot
+        return (
+            f"Elevator(id={self._id}, floor={state.current_floor}, "
+            f"direction={state.direction.name}, load={state.current_load}/{self._capacity})"
+        )
 
 
 
@@ -6,10 +6,14 @@ the fundamental concepts in the elevator domain.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum, auto
-from typing import Set, FrozenSet
-from uuid import UUID, uuid4
+from itertools import count
+from time import monotonic
+from typing import Optional, Set, FrozenSet, Tuple
+
+
+# Process-wide source of request ids; next() on a count is atomic in CPython
+_request_ids = count()
 
 
 class Direction(Enum):
@@ -24,11 +28,14 @@ class Direction(Enum):
     
     def opposite(self) -> "Direction":
         """Return the opposite direction (UP <-> DOWN, IDLE stays IDLE)."""
-        if self == Direction.UP:
-            return Direction.DOWN
-        elif self == Direction.DOWN:
-            return Direction.UP
-        return Direction.IDLE
+        return _OPPOSITE_DIRECTIONS[self]
+
+
+_OPPOSITE_DIRECTIONS = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.IDLE: Direction.IDLE,
+}
 
 
 class DoorState(Enum):
@@ -39,7 +46,7 @@ class DoorState(Enum):
     CLOSING = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Request:
     """
     Immutable value object representing an elevator request.
@@ -48,17 +55,20 @@ class Request:
     The direction is automatically computed from the pickup and destination floors.
     
     Attributes:
-        id: Unique identifier for tracking
+        id: Unique identifier for tracking (increasing int per process)
         pickup_floor: Floor where user is waiting
         destination_floor: Floor where user wants to go
-        timestamp: When the request was created
+        timestamp: When the request was created (time.monotonic() seconds)
         passengers: Number of passengers in this request (default 1)
     """
     pickup_floor: int
     destination_floor: int
-    id: UUID = field(default_factory=uuid4)
-    timestamp: datetime = field(default_factory=datetime.now)
+    id: int = field(default_factory=_request_ids.__next__)
+    timestamp: float = field(default_factory=monotonic)
     passengers: int = 1
+    # Derived once in __post_init__; the request is immutable
+    _direction: Direction = field(init=False, repr=False, compare=False)
+    _floors_to_serve: Tuple[int, int] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.pickup_floor == self.destination_floor:
@@ -68,18 +78,28 @@ class Request:
             )
         if self.passengers < 1:
             raise ValueError(f"Passengers must be >= 1, got {self.passengers}")
+        direction = (
+            Direction.UP if self.destination_floor > self.pickup_floor else Direction.DOWN
+        )
+        object.__setattr__(self, "_direction", direction)
+        # The floors always differ, so a sorted pair is as good as a set
+        object.__setattr__(
+            self,
+            "_floors_to_serve",
+            (self.pickup_floor, self.destination_floor)
+            if direction is Direction.UP
+            else (self.destination_floor, self.pickup_floor),
+        )
     
     @property
     def direction(self) -> Direction:
-        """Compute the direction of travel."""
-        if self.destination_floor > self.pickup_floor:
-            return Direction.UP
-        return Direction.DOWN
+        """The direction of travel."""
+        return self._direction
     
     @property
-    def floors_to_serve(self) -> FrozenSet[int]:
-        """Return the set of floors this request needs the elevator to stop at."""
-        return frozenset({self.pickup_floor, self.destination_floor})
+    def floors_to_serve(self) -> Tuple[int, int]:
+        """Return the floors this request needs the elevator to stop at, lowest first."""
+        return self._floors_to_serve
     
     def __hash__(self) -> int:
         return hash(self.id)
@@ -90,12 +110,13 @@ class Request:
         return self.id == other.id
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ElevatorState:
     """
     Represents the current state of an elevator.
     
-    This is a mutable snapshot that gets updated as the elevator moves.
+    This is an immutable snapshot; the elevator publishes a new one as it
+    moves, so a snapshot can be shared between threads safely.
     Used for reporting status and making dispatch decisions.
     """
     elevator_id: int
@@ -106,12 +127,21 @@ class ElevatorState:
     capacity: int
     pending_stops_up: FrozenSet[int] = field(default_factory=frozenset)
     pending_stops_down: FrozenSet[int] = field(default_factory=frozenset)
+    # When an event carrying this state happened, in time.monotonic()
+    # seconds; set for events raised in Elevator.step(), which all share
+    # one reading. None otherwise.
+    observed_at: Optional[float] = None
+    
+    @property
+    def now(self) -> float:
+        """observed_at if set, else the current time.monotonic()."""
+        return monotonic() if self.observed_at is None else self.observed_at
     
     @property
     def is_idle(self) -> bool:
         """Check if elevator has no pending work."""
         return (
-            self.direction == Direction.IDLE 
+            self.direction is Direction.IDLE 
             and len(self.pending_stops_up) == 0 
             and len(self.pending_stops_down) == 0
         )
@@ -141,6 +171,7 @@ class ElevatorState:
             capacity=self.capacity,
             pending_stops_up=self.pending_stops_up,
             pending_stops_down=self.pending_stops_down,
+            observed_at=self.observed_at,
         )
 
 
@@ -10,11 +10,40 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from functools import partial
+from queue import SimpleQueue
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 import logging
 
-from elevator_system.models import ElevatorState, Request
+from elevator_system.models import Direction, ElevatorState, Request
+
+
+# (observer method name, positional args) - args always start with the state
+ElevatorEvent = Tuple[str, Tuple[Any, ...]]
+
+# Notify levels - an observer receives events at or above its level
+NOTIFY_ALL = 0  # Movement and door events as well as request events
+NOTIFY_REQUESTS = 1  # Only request accepted/completed events
+
+EVENT_NAMES = (
+    "on_floor_reached",
+    "on_door_opened",
+    "on_door_closed",
+    "on_request_accepted",
+    "on_request_completed",
+    "on_direction_changed",
+)
+
+# Level of each event; observers receive events at or above their notify_level
+EVENT_LEVELS: Dict[str, int] = {
+    "on_floor_reached": NOTIFY_ALL,
+    "on_door_opened": NOTIFY_ALL,
+    "on_door_closed": NOTIFY_ALL,
+    "on_direction_changed": NOTIFY_ALL,
+    "on_request_accepted": NOTIFY_REQUESTS,
+    "on_request_completed": NOTIFY_REQUESTS,
+}
 
 
 class ElevatorObserver(ABC):
@@ -26,8 +55,14 @@ class ElevatorObserver(ABC):
     
     All methods have default no-op implementations, so subclasses
     only need to override the events they care about (ISP).
+    
+    Set notify_level to NOTIFY_REQUESTS (on the class or the instance,
+    before registering) to skip the high-frequency floor and door events
+    entirely.
     """
     
+    notify_level: int = NOTIFY_ALL
+    
     def on_floor_reached(self, state: ElevatorState, floor: int) -> None:
         """Called when elevator arrives at a new floor."""
         pass
@@ -51,6 +86,60 @@ class ElevatorObserver(ABC):
     def on_direction_changed(self, state: ElevatorState) -> None:
         """Called when elevator changes direction."""
         pass
+    
+    def on_events(self, events: Sequence[ElevatorEvent]) -> None:
+        """
+        Called with every event from one elevator step, in order.
+        
+        The default dispatches each event to its on_* method. Override
+        to handle the whole batch at once; the elevator then makes a
+        single call per step instead of one per event.
+        """
+        for name, args in events:
+            getattr(self, name)(*args)
+
+
+def overrides_event(observer: ElevatorObserver, name: str) -> bool:
+    """
+    Check whether an observer replaces the no-op default for an event.
+    
+    Objects whose class doesn't define the method at all (e.g. mocks)
+    are assumed to handle it.
+    """
+    return getattr(type(observer), name, None) is not getattr(ElevatorObserver, name)
+
+
+def notify_level_of(observer: ElevatorObserver) -> int:
+    """
+    An observer's notify level, including one set on the instance.
+    
+    Anything that isn't an int (e.g. a mock's auto-created attribute)
+    means NOTIFY_ALL.
+    """
+    level = getattr(observer, "notify_level", NOTIFY_ALL)
+    return level if isinstance(level, int) else NOTIFY_ALL
+
+
+def overrides_batch(observer: ElevatorObserver) -> bool:
+    """
+    Check whether an observer handles whole batches through on_events().
+    
+    Unlike overrides_event(), a class without the method (e.g. a mock)
+    counts as not overriding it, so its on_* methods are used.
+    """
+    base = ElevatorObserver.on_events
+    return getattr(type(observer), "on_events", base) is not base
+
+
+def _forward_as_batch(
+    on_events: Callable[[List[ElevatorEvent]], None], name: str, *args: Any
+) -> None:
+    """Hand a single event to an on_events() override."""
+    on_events([(name, args)])
+
+
+# Enum .name goes through a descriptor on every access; log messages use this
+_DIRECTION_NAMES = {direction: direction.name for direction in Direction}
 
 
 class LoggingObserver(ElevatorObserver):
@@ -64,43 +153,61 @@ class LoggingObserver(ElevatorObserver):
         self._logger = logger or logging.getLogger(__name__)
     
     def on_floor_reached(self, state: ElevatorState, floor: int) -> None:
+        # %-style arguments: logging only formats records it will emit
         self._logger.info(
-            f"[Elevator {state.elevator_id}] Reached floor {floor} "
-            f"(direction: {state.direction.name}, load: {state.current_load}/{state.capacity})"
+            "[Elevator %s] Reached floor %s (direction: %s, load: %s/%s)",
+            state.elevator_id, floor, _DIRECTION_NAMES[state.direction],
+            state.current_load, state.capacity,
         )
     
     def on_door_opened(self, state: ElevatorState) -> None:
         self._logger.debug(
-            f"[Elevator {state.elevator_id}] Doors opened at floor {state.current_floor}"
+            "[Elevator %s] Doors opened at floor %s",
+            state.elevator_id, state.current_floor,
         )
     
     def on_door_closed(self, state: ElevatorState) -> None:
         self._logger.debug(
-            f"[Elevator {state.elevator_id}] Doors closed at floor {state.current_floor}"
+            "[Elevator %s] Doors closed at floor %s",
+            state.elevator_id, state.current_floor,
         )
     
     def on_request_accepted(self, state: ElevatorState, request: Request) -> None:
         self._logger.info(
-            f"[Elevator {state.elevator_id}] Accepted request: "
-            f"floor {request.pickup_floor} -> {request.destination_floor} "
-            f"({request.passengers} passenger(s))"
+            "[Elevator %s] Accepted request: floor %s -> %s (%s passenger(s))",
+            state.elevator_id, request.pickup_floor, request.destination_floor,
+            request.passengers,
         )
     
     def on_request_completed(self, state: ElevatorState, request: Request) -> None:
-        wait_time = (datetime.now() - request.timestamp).total_seconds()
+        if not self._logger.isEnabledFor(logging.INFO):
+            return  # Skip the wait-time arithmetic too
+        wait_time = state.now - request.timestamp
         self._logger.info(
-            f"[Elevator {state.elevator_id}] Completed request: "
-            f"floor {request.pickup_floor} -> {request.destination_floor} "
-            f"(wait time: {wait_time:.1f}s)"
+            "[Elevator %s] Completed request: floor %s -> %s (wait time: %.1fs)",
+            state.elevator_id, request.pickup_floor, request.destination_floor,
+            wait_time,
         )
     
     def on_direction_changed(self, state: ElevatorState) -> None:
         self._logger.info(
-            f"[Elevator {state.elevator_id}] Direction changed to {state.direction.name} "
-            f"at floor {state.current_floor}"
+            "[Elevator %s] Direction changed to %s at floor %s",
+            state.elevator_id, _DIRECTION_NAMES[state.direction], state.current_floor,
         )
 
 
+class _ElevatorCounters:
+    """One elevator's share of a MetricsObserver's running totals."""
+    
+    __slots__ = ("requests_completed", "wait_time_seconds", "floor_visits", "load_sum")
+    
+    def __init__(self):
+        self.requests_completed = 0
+        self.wait_time_seconds = 0.0
+        self.floor_visits = 0
+        self.load_sum = 0  # Sampled once per floor visit
+
+
 class MetricsObserver(ElevatorObserver):
     """
     Observer that collects metrics about elevator operations.
@@ -109,45 +216,79 @@ class MetricsObserver(ElevatorObserver):
     - Request completion times
     - Floor visits
     - Load statistics
+    
+    When shared across elevators, each elevator only updates its own
+    counters (deliveries for one elevator never overlap); the totals are
+    summed on read.
     """
     
     def __init__(self):
-        self.total_requests_completed = 0
-        self.total_wait_time_seconds = 0.0
-        self.floor_visits: List[int] = []
-        self.load_samples: List[int] = []
+        # Running totals per elevator id, so memory stays constant however long the run
+        self._per_elevator: Dict[int, _ElevatorCounters] = {}
+    
+    def _counters(self, elevator_id: int) -> _ElevatorCounters:
+        counters = self._per_elevator.get(elevator_id)
+        if counters is None:
+            counters = self._per_elevator.setdefault(elevator_id, _ElevatorCounters())
+        return counters
     
     def on_floor_reached(self, state: ElevatorState, floor: int) -> None:
-        self.floor_visits.append(floor)
-        self.load_samples.append(state.current_load)
+        counters = self._counters(state.elevator_id)
+        counters.floor_visits += 1
+        counters.load_sum += state.current_load
     
     def on_request_completed(self, state: ElevatorState, request: Request) -> None:
-        self.total_requests_completed += 1
-        wait_time = (datetime.now() - request.timestamp).total_seconds()
-        self.total_wait_time_seconds += wait_time
+        counters = self._counters(state.elevator_id)
+        counters.requests_completed += 1
+        counters.wait_time_seconds += state.now - request.timestamp
+    
+    @property
+    def total_requests_completed(self) -> int:
+        """Requests completed across all elevators."""
+        return sum(c.requests_completed for c in list(self._per_elevator.values()))
+    
+    @property
+    def total_wait_time_seconds(self) -> float:
+        """Wait time of completed requests across all elevators."""
+        return sum(c.wait_time_seconds for c in list(self._per_elevator.values()))
+    
+    @property
+    def total_floor_visits(self) -> int:
+        """Floors reached across all elevators."""
+        return sum(c.floor_visits for c in list(self._per_elevator.values()))
+    
+    @property
+    def load_sum(self) -> int:
+        """Sum of the load sampled at every floor visit."""
+        return sum(c.load_sum for c in list(self._per_elevator.values()))
     
     @property
     def average_wait_time(self) -> float:
         """Calculate average wait time for completed requests."""
-        if self.total_requests_completed == 0:
+        completed = self.total_requests_completed
+        if completed == 0:
             return 0.0
-        return self.total_wait_time_seconds / self.total_requests_completed
+        return self.total_wait_time_seconds / completed
     
     @property
     def average_load(self) -> float:
         """Calculate average elevator load."""
-        if not self.load_samples:
+        visits = self.total_floor_visits
+        if visits == 0:
             return 0.0
-        return sum(self.load_samples) / len(self.load_samples)
+        return self.load_sum / visits
     
     def get_metrics(self) -> dict:
         """Return all collected metrics as a dictionary."""
+        completed = self.total_requests_completed
+        wait_time = self.total_wait_time_seconds
+        visits = self.total_floor_visits
         return {
-            "total_requests_completed": self.total_requests_completed,
-            "total_wait_time_seconds": self.total_wait_time_seconds,
-            "average_wait_time_seconds": self.average_wait_time,
-            "total_floor_visits": len(self.floor_visits),
-            "average_load": self.average_load,
+            "total_requests_completed": completed,
+            "total_wait_time_seconds": wait_time,
+            "average_wait_time_seconds": wait_time / completed if completed else 0.0,
+            "total_floor_visits": visits,
+            "average_load": self.load_sum / visits if visits else 0.0,
         }
 
 
@@ -160,40 +301,155 @@ class CompositeObserver(ElevatorObserver):
     """
     
     def __init__(self, observers: Optional[List[ElevatorObserver]] = None):
-        self._observers = observers or []
+        # Keyed by id() so removal is O(1); dicts keep insertion order
+        self._observers: Dict[int, ElevatorObserver] = {}
+        # Event name -> bound methods of the children that override it and
+        # listen at its level (children that only batch get their on_events
+        # one event at a time). Copy-on-write tuples: replaced on add/remove,
+        # never mutated, so they can be iterated while children change.
+        self._dispatch: Dict[str, Tuple[Callable[..., None], ...]] = {
+            name: () for name in EVENT_NAMES
+        }
+        self._lock = Lock()  # Serializes add/remove
+        for observer in observers or []:
+            self.add(observer)
     
     def add(self, observer: ElevatorObserver) -> None:
-        """Add a child observer."""
-        self._observers.append(observer)
+        """Add a child observer (adding the same one again has no effect)."""
+        with self._lock:
+            if id(observer) not in self._observers:
+                self._observers[id(observer)] = observer
+                self._rebuild_dispatch()
     
     def remove(self, observer: ElevatorObserver) -> None:
         """Remove a child observer."""
-        if observer in self._observers:
-            self._observers.remove(observer)
+        with self._lock:
+            if self._observers.pop(id(observer), None) is not None:
+                self._rebuild_dispatch()
+    
+    def _rebuild_dispatch(self) -> None:
+        """Publish fresh per-event callback tuples. Caller must hold the lock."""
+        children = list(self._observers.values())
+        levels = [notify_level_of(child) for child in children]
+        batching = [overrides_batch(child) for child in children]
+        self._dispatch = {
+            name: tuple(
+                partial(_forward_as_batch, child.on_events, name)
+                if batches
+                else getattr(child, name)
+                for child, level, batches in zip(children, levels, batching)
+                if EVENT_LEVELS[name] >= level and (batches or overrides_event(child, name))
+            )
+            for name in EVENT_NAMES
+        }
+    
+    def callbacks_for(self, name: str) -> Tuple[Callable[..., None], ...]:
+        """
+        The children's callbacks for an event, as of now.
+        
+        Elevators use this to call a composite's children directly
+        instead of going through the composite's on_* methods.
+        """
+        return self._dispatch[name]
+    
+    def on_floor_reached(self, state: ElevatorState, floor: int) -> None:
+        for callback in self._dispatch["on_floor_reached"]:
+            callback(state, floor)
+    
+    def on_door_opened(self, state: ElevatorState) -> None:
+        for callback in self._dispatch["on_door_opened"]:
+            callback(state)
+    
+    def on_door_closed(self, state: ElevatorState) -> None:
+        for callback in self._dispatch["on_door_closed"]:
+            callback(state)
+    
+    def on_request_accepted(self, state: ElevatorState, request: Request) -> None:
+        for callback in self._dispatch["on_request_accepted"]:
+            callback(state, request)
+    
+    def on_request_completed(self, state: ElevatorState, request: Request) -> None:
+        for callback in self._dispatch["on_request_completed"]:
+            callback(state, request)
+    
+    def on_direction_changed(self, state: ElevatorState) -> None:
+        for callback in self._dispatch["on_direction_changed"]:
+            callback(state)
+
+
+class QueuedObserver(ElevatorObserver):
+    """
+    Observer that forwards events to another observer on a background thread.
+    
+    The elevator only pays for a queue put per step (or per event, when
+    called through on_* methods); the wrapped observer runs on a dedicated
+    daemon thread, in event order, and gets whole batches if it overrides
+    on_events(). Wrap
+    observers that do slow work such as I/O (e.g. LoggingObserver) so
+    they don't stretch the simulation step.
+    
+    Usage:
+        queued = QueuedObserver(LoggingObserver())
+        system.add_observer_to_all(queued)
+        ...
+        queued.close()  # Deliver remaining events and stop the thread
+    """
+    
+    def __init__(self, observer: ElevatorObserver):
+        self._observer = observer
+        self.notify_level = notify_level_of(observer)  # Don't queue what it would skip
+        self._batches = overrides_batch(observer)
+        self._events: "SimpleQueue[Optional[Sequence[ElevatorEvent]]]" = SimpleQueue()
+        self._thread = Thread(
+            target=self._deliver_events,
+            daemon=True,
+            name="ElevatorObserverQueue",
+        )
+        self._thread.start()
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Deliver events queued so far, then stop the delivery thread."""
+        self._events.put(None)
+        self._thread.join(timeout=timeout)
+    
+    def _deliver_events(self) -> None:
+        """Delivery loop - runs in the background thread."""
+        while True:
+            events = self._events.get()
+            if events is None:
+                return
+            if self._batches:
+                try:
+                    self._observer.on_events(events)
+                except Exception:
+                    pass  # Same isolation the elevator gives synchronous observers
+                continue
+            for name, args in events:
+                try:
+                    getattr(self._observer, name)(*args)
+                except Exception:
+                    pass
+    
+    def on_events(self, events: Sequence[ElevatorEvent]) -> None:
+        self._events.put(list(events))
     
     def on_floor_reached(self, state: ElevatorState, floor: int) -> None:
-        for observer in self._observers:
-            observer.on_floor_reached(state, floor)
+        self._events.put([("on_floor_reached", (state, floor))])
     
     def on_door_opened(self, state: ElevatorState) -> None:
-        for observer in self._observers:
-            observer.on_door_opened(state)
+        self._events.put([("on_door_opened", (state,))])
     
     def on_door_closed(self, state: ElevatorState) -> None:
-        for observer in self._observers:
-            observer.on_door_closed(state)
+        self._events.put([("on_door_closed", (state,))])
     
     def on_request_accepted(self, state: ElevatorState, request: Request) -> None:
-        for observer in self._observers:
-            observer.on_request_accepted(state, request)
+        self._events.put([("on_request_accepted", (state, request))])
     
     def on_request_completed(self, state: ElevatorState, request: Request) -> None:
-        for observer in self._observers:
-            observer.on_request_completed(state, request)
+        self._events.put([("on_request_completed", (state, request))])
     
     def on_direction_changed(self, state: ElevatorState) -> None:
-        for observer in self._observers:
-            observer.on_direction_changed(state)
+        self._events.put([("on_direction_changed", (state,))])
 
 
 
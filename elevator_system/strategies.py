@@ -15,7 +15,8 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, TYPE_CHECKING
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from elevator_system.models import Direction, Request, ElevatorState
 
@@ -23,6 +24,30 @@ if TYPE_CHECKING:
     from elevator_system.elevator import Elevator
 
 
+# LOOK score multiplier keyed by (elevator direction, side of the pickup
+# relative to the elevator: -1 below / 0 level / 1 above, request direction).
+# Idle elevators have no entry and keep a factor of 1.0.
+_DIRECTION_FACTORS = {
+    # Going up, pickup at or above: ideal if the request also goes up,
+    # otherwise it is picked up after reversing or on the return trip
+    (Direction.UP, 0, Direction.UP): 0.5,
+    (Direction.UP, 1, Direction.UP): 0.5,
+    (Direction.UP, 0, Direction.DOWN): 1.5,
+    (Direction.UP, 1, Direction.DOWN): 1.5,
+    # Going up, pickup below: must reverse first
+    (Direction.UP, -1, Direction.UP): 2.0,
+    (Direction.UP, -1, Direction.DOWN): 2.0,
+    # Going down, pickup at or below
+    (Direction.DOWN, 0, Direction.DOWN): 0.5,
+    (Direction.DOWN, -1, Direction.DOWN): 0.5,
+    (Direction.DOWN, 0, Direction.UP): 1.5,
+    (Direction.DOWN, -1, Direction.UP): 1.5,
+    # Going down, pickup above
+    (Direction.DOWN, 1, Direction.DOWN): 2.0,
+    (Direction.DOWN, 1, Direction.UP): 2.0,
+}
+
+
 class DispatchStrategy(ABC):
     """
     Abstract base class for elevator dispatch strategies.
@@ -38,7 +63,7 @@ class DispatchStrategy(ABC):
     def select_elevator(
         self,
         request: Request,
-        elevators: List["Elevator"],
+        elevators: Sequence["Elevator"],
     ) -> Optional["Elevator"]:
         """
         Select the best elevator to handle the given request.
@@ -52,16 +77,94 @@ class DispatchStrategy(ABC):
         """
         pass
     
+    def select_elevators_batch(
+        self,
+        requests: Sequence[Request],
+        elevators: Sequence["Elevator"],
+    ) -> List[Optional["Elevator"]]:
+        """
+        Select an elevator for each of several requests in one call.
+        
+        All selections are made against the same fleet state; the caller
+        assigns the requests afterwards. Strategies that can share
+        per-elevator work across requests should override this; the
+        default simply calls select_elevator() once per request.
+        
+        Args:
+            requests: The requests to be assigned
+            elevators: List of available elevators
+            
+        Returns:
+            One selected elevator (or None) per request, in order
+        """
+        return [self.select_elevator(request, elevators) for request in requests]
+    
     def _get_compatible_elevators(
         self,
         request: Request,
-        elevators: List["Elevator"],
+        elevators: Sequence["Elevator"],
     ) -> List["Elevator"]:
         """Filter elevators that can accept the request."""
         return [e for e in elevators if e.can_accept_request(request)]
+    
+    def _snapshot_fleet(
+        self,
+        elevators: Sequence["Elevator"],
+    ) -> List[Tuple["Elevator", ElevatorState]]:
+        """Read every elevator's state once, for reuse across a batch."""
+        return [(e, e.get_state()) for e in elevators]
+    
+    def _get_compatible_in_snapshot(
+        self,
+        request: Request,
+        snapshot: Sequence[Tuple["Elevator", ElevatorState]],
+    ) -> List[Tuple["Elevator", ElevatorState]]:
+        """Filter (elevator, state) pairs whose elevator can accept the request."""
+        return [pair for pair in snapshot if pair[0].can_accept_request(request)]
 
 
-class LookDispatchStrategy(DispatchStrategy):
+class SnapshotDispatchStrategy(DispatchStrategy):
+    """
+    Base for strategies that choose by looking at elevator state.
+    
+    Subclasses implement _select_from_candidates() over (elevator, state)
+    pairs. A single dispatch reads state for the compatible elevators
+    only; a batch reads the whole fleet once and reuses that snapshot
+    for every request in it.
+    """
+    
+    def select_elevator(
+        self,
+        request: Request,
+        elevators: Sequence["Elevator"],
+    ) -> Optional["Elevator"]:
+        compatible = self._get_compatible_elevators(request, elevators)
+        return self._select_from_candidates(request, self._snapshot_fleet(compatible))
+    
+    def select_elevators_batch(
+        self,
+        requests: Sequence[Request],
+        elevators: Sequence["Elevator"],
+    ) -> List[Optional["Elevator"]]:
+        snapshot = self._snapshot_fleet(elevators)
+        return [
+            self._select_from_candidates(
+                request, self._get_compatible_in_snapshot(request, snapshot)
+            )
+            for request in requests
+        ]
+    
+    @abstractmethod
+    def _select_from_candidates(
+        self,
+        request: Request,
+        candidates: Sequence[Tuple["Elevator", ElevatorState]],
+    ) -> Optional["Elevator"]:
+        """Pick one of the compatible (elevator, state) pairs, or None."""
+        pass
+
+
+class LookDispatchStrategy(SnapshotDispatchStrategy):
     """
     Dispatch strategy based on the LOOK elevator algorithm.
     
@@ -73,24 +176,22 @@ class LookDispatchStrategy(DispatchStrategy):
     This minimizes wait time by leveraging existing elevator movement.
     """
     
-    def select_elevator(
+    def _select_from_candidates(
         self,
         request: Request,
-        elevators: List["Elevator"],
+        candidates: Sequence[Tuple["Elevator", ElevatorState]],
     ) -> Optional["Elevator"]:
-        compatible = self._get_compatible_elevators(request, elevators)
-        if not compatible:
-            return None
-        
+        """Pick the lowest-scoring of the compatible (elevator, state) pairs."""
         pickup_floor = request.pickup_floor
         request_direction = request.direction
         
         best_elevator: Optional["Elevator"] = None
         best_score = float("inf")
         
-        for elevator in compatible:
-            state = elevator.get_state()
-            score = self._calculate_score(state, pickup_floor, request_direction)
+        # Resolve the bound method once rather than per candidate
+        calculate_score = self._calculate_score
+        for elevator, state in candidates:
+            score = calculate_score(state, pickup_floor, request_direction)
             
             if score < best_score:
                 best_score = score
@@ -114,48 +215,24 @@ class LookDispatchStrategy(DispatchStrategy):
         - Whether elevator direction matches request direction
         - Number of pending stops (less is better)
         """
-        distance = state.distance_to(pickup_floor)
+        # Read each field once; this runs per candidate for every dispatch
+        current = state.current_floor
+        direction = state.direction
+        pending_stops = len(state.pending_stops_up) + len(state.pending_stops_down)
         
         # Base score is distance
-        score = float(distance)
+        score = float(abs(current - pickup_floor))
         
-        if state.is_idle:
-            # Idle elevators are good, small penalty for pending stops
-            score += state.total_pending_stops * 0.5
+        if direction is Direction.IDLE and not pending_stops:
+            # Idle elevators are good - and have no pending stops to penalize
             return score
         
-        current = state.current_floor
-        direction = state.direction
-        
-        # Check if elevator will pass this floor on its way
-        if direction == Direction.UP:
-            if pickup_floor >= current:
-                if request_direction == Direction.UP:
-                    # Perfect: going up, pickup above, request going up
-                    score *= 0.5
-                else:
-                    # Going up, pickup above, but request going down
-                    # Will need to pick up after reversing or on return
-                    score *= 1.5
-            else:
-                # Pickup is below, elevator going up
-                # Will need to reverse first
-                score *= 2.0
-                
-        elif direction == Direction.DOWN:
-            if pickup_floor <= current:
-                if request_direction == Direction.DOWN:
-                    # Perfect: going down, pickup below, request going down
-                    score *= 0.5
-                else:
-                    # Going down, pickup below, but request going up
-                    score *= 1.5
-            else:
-                # Pickup is above, elevator going down
-                score *= 2.0
+        # Direction factor: whether the elevator will pass this floor on its way
+        side = (pickup_floor > current) - (pickup_floor < current)
+        score *= _DIRECTION_FACTORS.get((direction, side, request_direction), 1.0)
         
         # Penalize busy elevators
-        score += state.total_pending_stops * 0.3
+        score += pending_stops * 0.3
         
         # Penalize full elevators
         if state.current_load >= state.capacity * 0.8:
@@ -164,7 +241,7 @@ class LookDispatchStrategy(DispatchStrategy):
         return score
 
 
-class NearestElevatorStrategy(DispatchStrategy):
+class NearestElevatorStrategy(SnapshotDispatchStrategy):
     """
     Simple strategy that selects the nearest available elevator.
     
@@ -176,34 +253,25 @@ class NearestElevatorStrategy(DispatchStrategy):
     for high-traffic scenarios.
     """
     
-    def select_elevator(
+    def _select_from_candidates(
         self,
         request: Request,
-        elevators: List["Elevator"],
+        candidates: Sequence[Tuple["Elevator", ElevatorState]],
     ) -> Optional["Elevator"]:
-        compatible = self._get_compatible_elevators(request, elevators)
-        if not compatible:
+        """Pick the nearest of the compatible (elevator, state) pairs, idle first."""
+        if not candidates:
             return None
         
         pickup_floor = request.pickup_floor
         
-        # First, try to find idle elevators
-        idle_elevators = [
-            e for e in compatible
-            if e.get_state().is_idle
-        ]
-        
-        if idle_elevators:
-            return min(
-                idle_elevators,
-                key=lambda e: e.get_state().distance_to(pickup_floor)
-            )
-        
-        # Otherwise, find the closest elevator
+        # One pass: idle elevators rank ahead of busy ones, then by distance
         return min(
-            compatible,
-            key=lambda e: e.get_state().distance_to(pickup_floor)
-        )
+            candidates,
+            key=lambda pair: (
+                not pair[1].is_idle,
+                abs(pair[1].current_floor - pickup_floor),
+            ),
+        )[0]
 
 
 class FCFSDispatchStrategy(DispatchStrategy):
@@ -224,26 +292,27 @@ class FCFSDispatchStrategy(DispatchStrategy):
     def select_elevator(
         self,
         request: Request,
-        elevators: List["Elevator"],
+        elevators: Sequence["Elevator"],
     ) -> Optional["Elevator"]:
         compatible = self._get_compatible_elevators(request, elevators)
         if not compatible:
             return None
         
         # Find next compatible elevator in round-robin order
+        compatible_ids = {id(e) for e in compatible}
         n = len(elevators)
-        for _ in range(n):
-            idx = self._next_index % n
-            self._next_index = (self._next_index + 1) % n
-            
-            if elevators[idx] in compatible:
+        start = self._next_index % n  # The fleet may have shrunk since last call
+        for step in range(n):
+            idx = (start + step) % n
+            if id(elevators[idx]) in compatible_ids:
+                self._next_index = (idx + 1) % n
                 return elevators[idx]
         
         # Fallback to first compatible
         return compatible[0]
 
 
-class ZonedDispatchStrategy(DispatchStrategy):
+class ZonedDispatchStrategy(SnapshotDispatchStrategy):
     """
     Strategy that assigns elevators to serve specific floor zones.
     
@@ -260,42 +329,63 @@ class ZonedDispatchStrategy(DispatchStrategy):
         Initialize with zone assignments.
         
         Args:
-            zone_assignments: Dict mapping elevator_id to (min_floor, max_floor) zone
+            zone_assignments: Dict mapping elevator_id to (min_floor, max_floor) zone.
+                It is copied; use set_zone() to change zones afterwards.
         """
-        self._zone_assignments = zone_assignments or {}
+        self._zone_assignments = dict(zone_assignments or {})
         self._fallback = NearestElevatorStrategy()
+        # Dispatch may run concurrently with set_zone(), so readers use a
+        # published snapshot: the zones as a tuple of (elevator_id, zone)
+        # items, plus its own floor -> zoned elevator ids cache, filled on
+        # first use per floor. set_zone() swaps in a new pair.
+        self._lock = Lock()  # Serializes set_zone()
+        self._zone_view: Tuple[
+            Tuple[Tuple[int, Tuple[int, int]], ...], Dict[int, FrozenSet[int]]
+        ] = (tuple(self._zone_assignments.items()), {})
     
     def set_zone(self, elevator_id: int, min_floor: int, max_floor: int) -> None:
         """Assign a zone to an elevator."""
-        self._zone_assignments[elevator_id] = (min_floor, max_floor)
+        with self._lock:
+            self._zone_assignments[elevator_id] = (min_floor, max_floor)
+            self._zone_view = (tuple(self._zone_assignments.items()), {})
     
-    def select_elevator(
+    def _zone_ids_for(self, floor: int) -> FrozenSet[int]:
+        """Ids of the elevators whose zone includes the floor."""
+        zones, cache = self._zone_view  # Only ever write to the cache read here
+        ids = cache.get(floor)
+        if ids is None:
+            ids = frozenset(
+                elevator_id for elevator_id, (low, high) in zones if low <= floor <= high
+            )
+            cache[floor] = ids
+        return ids
+    
+    def _select_from_candidates(
         self,
         request: Request,
-        elevators: List["Elevator"],
+        candidates: Sequence[Tuple["Elevator", ElevatorState]],
     ) -> Optional["Elevator"]:
-        compatible = self._get_compatible_elevators(request, elevators)
-        if not compatible:
+        """Pick the nearest in-zone candidate, else defer to nearest overall."""
+        if not candidates:
             return None
         
         pickup_floor = request.pickup_floor
         
         # Find elevators whose zone includes the pickup floor
-        zone_elevators = []
-        for elevator in compatible:
-            zone = self._zone_assignments.get(elevator.id)
-            if zone and zone[0] <= pickup_floor <= zone[1]:
-                zone_elevators.append(elevator)
+        zone_ids = self._zone_ids_for(pickup_floor)
+        zone_candidates = (
+            [pair for pair in candidates if pair[0].id in zone_ids] if zone_ids else []
+        )
         
-        if zone_elevators:
+        if zone_candidates:
             # Select the best one within the zone
             return min(
-                zone_elevators,
-                key=lambda e: e.get_state().distance_to(pickup_floor)
-            )
+                zone_candidates,
+                key=lambda pair: abs(pair[1].current_floor - pickup_floor),
+            )[0]
         
-        # Fallback to nearest elevator
-        return self._fallback.select_elevator(request, compatible)
+        # Fallback to nearest elevator, reusing the states already read
+        return self._fallback._select_from_candidates(request, candidates)
 
 
 
@@ -0,0 +1,37 @@
+"""Shared fixtures for the elevator system tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from elevator_system.observers import ElevatorObserver
+
+
+class RecordingObserver(ElevatorObserver):
+    """Cheap stand-in for Mock(spec=ElevatorObserver) in call-recording tests."""
+    
+    def __init__(self, raise_on_accept: bool = False):
+        self.accepted = []
+        self.floors = []
+        self._raise_on_accept = raise_on_accept
+    
+    def on_request_accepted(self, state, request):
+        if self._raise_on_accept:
+            raise RuntimeError("Observer failed")
+        self.accepted.append(request)
+    
+    def on_floor_reached(self, state, floor):
+        self.floors.append(floor)
+
+
+@pytest.fixture
+def recorder():
+    """Factory for RecordingObserver; call it once per observer needed."""
+    return RecordingObserver
+
+
+@pytest.fixture(scope="session")
+def executor():
+    """Worker threads shared by the concurrency tests, started once per run."""
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="test-worker") as pool:
+        yield pool
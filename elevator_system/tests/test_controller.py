@@ -1,8 +1,9 @@
 """Tests for ElevatorController."""
 
+import asyncio
 import pytest
 import time
-from threading import Thread
+from threading import Event, Timer, current_thread
 from unittest.mock import Mock
 
 from elevator_system.controller import ElevatorController
@@ -62,7 +63,21 @@ class TestControllerRequestHandling:
         
         assert request.passengers == 3
     
-    def test_concurrent_requests_are_thread_safe(self):
+    def test_submitted_request_is_dispatched_on_next_step(self):
+        elevators = [Elevator(elevator_id=0)]
+        controller = ElevatorController(elevators)
+        
+        controller.submit_request(from_floor=0, to_floor=5)
+        
+        assert elevators[0].get_state().total_pending_stops == 0
+        assert controller.get_system_status()["pending_requests"] == 1
+        
+        controller.step()
+        
+        assert controller.get_system_status()["pending_requests"] == 0
+        assert elevators[0].get_state().total_pending_stops > 0
+    
+    def test_concurrent_requests_are_thread_safe(self, executor):
         elevators = [Elevator(elevator_id=i, capacity=100) for i in range(3)]
         controller = ElevatorController(elevators)
         
@@ -76,11 +91,9 @@ class TestControllerRequestHandling:
                 )
                 requests.append(req)
         
-        threads = [Thread(target=make_requests) for _ in range(5)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        futures = [executor.submit(make_requests) for _ in range(5)]
+        for future in futures:
+            future.result()
         
         assert len(requests) == 50
 
@@ -107,6 +120,83 @@ class TestControllerSimulation:
         
         assert not controller.is_running()
     
+    def test_restart_after_stop(self):
+        elevators = [Elevator(elevator_id=0)]
+        controller = ElevatorController(elevators, step_interval_seconds=0.01)
+        
+        controller.start()
+        controller.stop()
+        controller.start()
+        
+        assert controller.is_running()
+        assert controller.get_system_status()["running"] is True
+        
+        controller.stop()
+        assert not controller.is_running()
+    
+    def test_stop_wakes_loop_without_waiting_for_interval(self):
+        elevators = [Elevator(elevator_id=0)]
+        controller = ElevatorController(elevators, step_interval_seconds=10.0)
+        
+        controller.start()
+        started = time.monotonic()
+        controller.stop()
+        
+        assert time.monotonic() - started < 1.0
+    
+    def test_run_async_steps_until_stopped(self):
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        controller = ElevatorController([elevator], step_interval_seconds=0.01)
+        controller.request_elevator(from_floor=0, to_floor=3)
+        
+        async def scenario():
+            task = asyncio.create_task(controller.run_async())
+            await asyncio.sleep(0.1)
+            assert controller.is_running()
+            controller.stop()
+            await task
+        
+        asyncio.run(scenario())
+        
+        assert not controller.is_running()
+        assert elevator.get_state().current_floor == 3
+    
+    def test_run_async_waits_for_stopping_thread(self):
+        controller = ElevatorController(
+            [Elevator(elevator_id=0)], step_interval_seconds=0.01
+        )
+        entered = Event()
+        release = Event()
+        overlapped = []
+        original_step = controller.step
+        
+        def step():
+            if current_thread().name == "ElevatorSimulation":
+                entered.set()
+                release.wait(timeout=2.0)
+            else:
+                overlapped.append(previous.is_alive())
+            original_step()
+        
+        controller.step = step
+        controller.start()
+        assert entered.wait(timeout=2.0)
+        previous = controller._simulation_thread
+        controller.stop(timeout=0.01)  # Returns while the thread is mid-step
+        assert previous.is_alive()
+        
+        Timer(0.1, release.set).start()
+        
+        async def scenario():
+            task = asyncio.create_task(controller.run_async())
+            await asyncio.sleep(0.05)
+            controller.stop()
+            await task
+        
+        asyncio.run(scenario())
+        
+        assert overlapped and not any(overlapped)
+    
     def test_step_advances_elevators(self):
         elevators = [Elevator(elevator_id=0, start_floor=0)]
         controller = ElevatorController(elevators)
@@ -163,6 +253,26 @@ class TestControllerObservers:
         controller.request_elevator(from_floor=0, to_floor=5)
         
         observer.on_request_accepted.assert_not_called()
+    
+    def test_bulk_add_and_remove_observers(self):
+        elevators = [Elevator(elevator_id=i) for i in range(3)]
+        controller = ElevatorController(elevators)
+        
+        first = Mock(spec=ElevatorObserver)
+        second = Mock(spec=ElevatorObserver)
+        controller.add_observers_to_all([first, second])
+        controller.request_elevator(from_floor=0, to_floor=5)
+        
+        assert first.on_request_accepted.called
+        assert second.on_request_accepted.called
+        
+        controller.remove_observers_from_all([first, second])
+        first.reset_mock()
+        second.reset_mock()
+        controller.request_elevator(from_floor=0, to_floor=5)
+        
+        first.on_request_accepted.assert_not_called()
+        second.on_request_accepted.assert_not_called()
 
 
 class TestControllerStatus:
@@ -179,6 +289,18 @@ class TestControllerStatus:
         assert status["running"] is False
         assert len(status["elevators"]) == 3
     
+    def test_summary_status_skips_elevator_list(self):
+        elevators = [Elevator(elevator_id=i, capacity=8) for i in range(3)]
+        controller = ElevatorController(elevators)
+        controller.request_elevator(from_floor=0, to_floor=5, passengers=2)
+        
+        status = controller.get_system_status(include_elevators=False)
+        
+        assert "elevators" not in status
+        assert status["idle_elevators"] == controller.idle_count() == 2
+        assert status["total_capacity"] == 24
+        assert status["pending_requests"] == controller.pending_count() == 0
+    
     def test_status_reflects_elevator_state(self):
         elevators = [Elevator(elevator_id=0)]
         controller = ElevatorController(elevators)
@@ -1,12 +1,19 @@
 """Tests for the Elevator class."""
 
 import pytest
-from threading import Thread
+import time
+from threading import Event, Thread, current_thread
 from unittest.mock import Mock
 
 from elevator_system.elevator import Elevator
 from elevator_system.models import Direction, DoorState, Request
-from elevator_system.observers import ElevatorObserver
+from elevator_system.observers import (
+    NOTIFY_REQUESTS,
+    CompositeObserver,
+    ElevatorObserver,
+    MetricsObserver,
+    QueuedObserver,
+)
 
 
 class TestElevatorInitialization:
@@ -35,17 +42,17 @@ class TestElevatorInitialization:
         assert state.current_floor == 10
         assert state.capacity == 12
     
-    def test_reject_invalid_floor_range(self):
-        with pytest.raises(ValueError, match="min_floor"):
-            Elevator(elevator_id=0, min_floor=10, max_floor=5)
-    
-    def test_reject_invalid_start_floor(self):
-        with pytest.raises(ValueError, match="start_floor"):
-            Elevator(elevator_id=0, min_floor=0, max_floor=10, start_floor=15)
-    
-    def test_reject_zero_capacity(self):
-        with pytest.raises(ValueError, match="capacity"):
-            Elevator(elevator_id=0, capacity=0)
+    @pytest.mark.parametrize(
+        "config, message",
+        [
+            ({"min_floor": 10, "max_floor": 5}, "min_floor"),  # Inverted floor range
+            ({"min_floor": 0, "max_floor": 10, "start_floor": 15}, "start_floor"),
+            ({"capacity": 0}, "capacity"),
+        ],
+    )
+    def test_reject_invalid_config(self, config, message):
+        with pytest.raises(ValueError, match=message):
+            Elevator(elevator_id=0, **config)
 
 
 class TestElevatorRequestHandling:
@@ -130,72 +137,471 @@ class TestElevatorMovement:
         elevator.add_request(Request(pickup_floor=2, destination_floor=4))
         
         # Elevator should visit floors in order: 0 -> 2 -> 4 -> 5
-        visited_floors = []
-        for _ in range(10):  # Enough steps to complete
-            state = elevator.get_state()
-            if state.current_floor not in visited_floors:
-                visited_floors.append(state.current_floor)
-            elevator.step()
-            if state.is_idle:
-                break
+        visited_floors = elevator.run_until_idle(10)  # Enough steps to complete
         
         # Should visit floors in ascending order
         assert visited_floors == sorted(visited_floors)
+        assert visited_floors[-1] == 5
+        assert elevator.get_state().is_idle
+    
+    def test_load_tracks_passengers_boarding_and_exiting(self):
+        elevator = Elevator(elevator_id=0, start_floor=0, capacity=4)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=2, passengers=3))
+        
+        elevator.step()  # Board at 0, move to 1
+        assert elevator.get_state().current_load == 3
+        
+        elevator.step()  # Exit at 2
+        assert elevator.get_state().current_load == 0
+    
+    def test_serves_basement_floors(self):
+        elevator = Elevator(elevator_id=0, min_floor=-2, max_floor=3, start_floor=0)
+        elevator.add_request(Request(pickup_floor=-1, destination_floor=-2))
+        
+        assert elevator.get_state().pending_stops_down == {-1, -2}
+        
+        for _ in range(5):
+            elevator.step()
+        
+        state = elevator.get_state()
+        assert state.current_floor == -2
+        assert state.is_idle
 
 
 class TestElevatorObservers:
     """Tests for observer notifications."""
     
-    def test_observer_receives_request_accepted(self):
+    def test_observer_receives_request_accepted(self, recorder):
         elevator = Elevator(elevator_id=0)
-        observer = Mock(spec=ElevatorObserver)
+        observer = recorder()
         elevator.add_observer(observer)
         
         request = Request(pickup_floor=0, destination_floor=5)
         elevator.add_request(request)
         
-        observer.on_request_accepted.assert_called_once()
-        call_args = observer.on_request_accepted.call_args
-        assert call_args[0][1] == request
+        assert observer.accepted == [request]
     
-    def test_observer_receives_floor_reached(self):
+    def test_observer_receives_floor_reached(self, recorder):
         elevator = Elevator(elevator_id=0, start_floor=0)
-        observer = Mock(spec=ElevatorObserver)
+        observer = recorder()
         elevator.add_observer(observer)
         
         request = Request(pickup_floor=0, destination_floor=2)
         elevator.add_request(request)
         elevator.step()
         
-        observer.on_floor_reached.assert_called()
+        assert observer.floors == [1]
     
-    def test_observer_error_does_not_crash_elevator(self):
+    def test_observer_error_does_not_crash_elevator(self, recorder):
         elevator = Elevator(elevator_id=0)
         
-        bad_observer = Mock(spec=ElevatorObserver)
-        bad_observer.on_request_accepted.side_effect = RuntimeError("Observer failed")
+        bad_observer = recorder(raise_on_accept=True)
         elevator.add_observer(bad_observer)
         
         # Should not raise
         request = Request(pickup_floor=0, destination_floor=5)
         elevator.add_request(request)
     
-    def test_remove_observer(self):
+    def test_add_observers_registers_each_once(self, recorder):
+        elevator = Elevator(elevator_id=0)
+        observer = recorder()
+        elevator.add_observers([observer, observer])
+        
+        request = Request(pickup_floor=0, destination_floor=5)
+        elevator.add_request(request)
+        
+        assert observer.accepted == [request]
+    
+    def test_events_keep_causal_order_across_threads(self):
+        class Order(ElevatorObserver):
+            def __init__(self):
+                self.events = []
+            
+            def on_request_accepted(self, state, request):
+                self.events.append("accepted")
+            
+            def on_request_completed(self, state, request):
+                self.events.append("completed")
+        
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        observer = Order()
+        elevator.add_observer(observer)
+        
+        # Stall the adding thread after it releases the lock, before delivery
+        flush = elevator._flush_outbox
+        stalled = Event()
+        
+        def slow_flush():
+            if current_thread() is adder:
+                stalled.set()
+                time.sleep(0.2)
+            flush()
+        
+        elevator._flush_outbox = slow_flush
+        adder = Thread(
+            target=elevator.add_request,
+            args=(Request(pickup_floor=0, destination_floor=1),),
+            daemon=True,
+        )
+        adder.start()
+        assert stalled.wait(timeout=2.0)
+        
+        # Meanwhile this thread completes the request and delivers first
+        for _ in range(3):
+            elevator.step()
+        adder.join(timeout=2.0)
+        
+        assert observer.events == ["accepted", "completed"]
+    
+    def test_observer_can_call_back_into_elevator(self):
+        class FollowUp(ElevatorObserver):
+            def __init__(self, elevator):
+                self.elevator = elevator
+                self.seen = []
+            
+            def on_request_completed(self, state, request):
+                self.seen.append(repr(self.elevator))
+                if request.destination_floor == 1:
+                    self.elevator.add_request(Request(pickup_floor=1, destination_floor=2))
+        
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        observer = FollowUp(elevator)
+        elevator.add_observer(observer)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=1))
+        
+        def run():
+            for _ in range(5):
+                elevator.step()
+        
+        # A deadlock would leave the worker stuck; don't hang the suite on it
+        worker = Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=2.0)
+        
+        assert not worker.is_alive()
+        assert len(observer.seen) == 2
+        assert elevator.get_state().current_floor == 2
+    
+    def test_set_observers_replaces_observers_but_keeps_subscriptions(self, recorder):
+        elevator = Elevator(elevator_id=0)
+        old = recorder()
+        new = recorder()
+        accepted = []
+        elevator.add_observer(old)
+        elevator.subscribe("on_request_accepted", lambda state, request: accepted.append(request))
+        
+        elevator.set_observers([new])
+        request = Request(pickup_floor=0, destination_floor=5)
+        elevator.add_request(request)
+        
+        assert old.accepted == []
+        assert new.accepted == [request]
+        assert accepted == [request]
+    
+    def test_queued_observer_delivers_events_in_background(self):
         elevator = Elevator(elevator_id=0)
         observer = Mock(spec=ElevatorObserver)
+        queued = QueuedObserver(observer)
+        elevator.add_observer(queued)
+        
+        request = Request(pickup_floor=0, destination_floor=5)
+        elevator.add_request(request)
+        queued.close()
+        
+        observer.on_request_accepted.assert_called_once()
+        assert observer.on_request_accepted.call_args[0][1] == request
+    
+    def test_remove_observer(self, recorder):
+        elevator = Elevator(elevator_id=0)
+        observer = recorder()
         elevator.add_observer(observer)
         elevator.remove_observer(observer)
         
         request = Request(pickup_floor=0, destination_floor=5)
         elevator.add_request(request)
         
-        observer.on_request_accepted.assert_not_called()
+        assert observer.accepted == []
+    
+    def test_batched_observer_receives_one_call_per_step(self):
+        class BatchObserver(ElevatorObserver):
+            def __init__(self):
+                self.batches = []
+            
+            def on_events(self, events):
+                self.batches.append([name for name, _ in events])
+        
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        observer = BatchObserver()
+        elevator.add_observer(observer)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=1))
+        
+        elevator.step()
+        
+        assert observer.batches == [
+            ["on_request_accepted"],
+            [
+                "on_door_opened",
+                "on_door_closed",
+                "on_floor_reached",
+                "on_door_opened",
+                "on_request_completed",
+                "on_door_closed",
+            ],
+        ]
+    
+    def test_step_events_share_one_timestamp(self):
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        observer = Mock(spec=ElevatorObserver)
+        elevator.add_observer(observer)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=1))
+        
+        elevator.step()
+        
+        states = [
+            call.args[0]
+            for call in observer.method_calls
+            if call[0] != "on_request_accepted"
+        ]
+        assert len(states) == 6
+        assert states[0].observed_at is not None
+        assert all(s.observed_at is states[0].observed_at for s in states)
+    
+    def test_request_level_observer_skips_movement_events(self):
+        class RequestsOnly(ElevatorObserver):
+            notify_level = NOTIFY_REQUESTS
+            
+            def __init__(self):
+                self.events = []
+            
+            def on_events(self, events):
+                self.events.extend(name for name, _ in events)
+        
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        quiet = RequestsOnly()
+        chatty = Mock(spec=ElevatorObserver)
+        elevator.add_observers([quiet, chatty])
+        elevator.add_request(Request(pickup_floor=0, destination_floor=2))
+        
+        for _ in range(3):
+            elevator.step()
+        
+        assert quiet.events == ["on_request_accepted", "on_request_completed"]
+        chatty.on_floor_reached.assert_called()
+        chatty.on_request_completed.assert_called_once()
+    
+    def test_notify_level_set_on_instance_is_honoured(self, recorder):
+        observer = recorder()
+        observer.notify_level = NOTIFY_REQUESTS
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        elevator.add_observer(observer)
+        
+        request = Request(pickup_floor=0, destination_floor=2)
+        elevator.add_request(request)
+        elevator.run_until_idle(5)
+        
+        assert observer.accepted == [request]
+        assert observer.floors == []
+    
+    def test_subscribed_callback_receives_only_its_event(self):
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        floors = []
+        
+        def record(state, floor):
+            floors.append(floor)
+        
+        elevator.subscribe("on_floor_reached", record)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=2))
+        elevator.step()
+        elevator.step()
+        
+        assert floors == [1, 2]
+        
+        elevator.unsubscribe("on_floor_reached", record)
+        elevator.add_request(Request(pickup_floor=2, destination_floor=3))
+        elevator.step()
+        
+        assert floors == [1, 2]
+    
+    def test_subscribe_rejects_unknown_event(self):
+        elevator = Elevator(elevator_id=0)
+        
+        with pytest.raises(ValueError, match="Unknown event"):
+            elevator.subscribe("on_explode", lambda state: None)
+    
+    def test_composite_observer_forwards_to_children_until_removed(self):
+        metrics = MetricsObserver()
+        child = Mock(spec=ElevatorObserver)
+        composite = CompositeObserver([metrics, child])
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        elevator.add_observer(composite)
+        
+        elevator.add_request(Request(pickup_floor=0, destination_floor=1))
+        elevator.step()
+        
+        assert metrics.total_requests_completed == 1
+        child.on_request_completed.assert_called_once()
+        
+        composite.remove(child)
+        elevator.add_request(Request(pickup_floor=1, destination_floor=0))
+        elevator.step()
+        
+        assert metrics.total_requests_completed == 2
+        child.on_request_completed.assert_called_once()
+    
+    def test_child_added_to_registered_composite_receives_events(self):
+        composite = CompositeObserver()
+        elevator = Elevator(elevator_id=0)
+        elevator.add_observer(composite)
+        
+        child = Mock(spec=ElevatorObserver)
+        composite.add(child)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=5))
+        
+        child.on_request_accepted.assert_called_once()
+    
+    def test_batch_observer_receives_events_through_wrappers(self):
+        class BatchRecorder(ElevatorObserver):
+            def __init__(self):
+                self.names = []
+            
+            def on_events(self, events):
+                self.names.extend(name for name, _ in events)
+        
+        def run(observer):
+            elevator = Elevator(elevator_id=0, start_floor=0)
+            elevator.add_observer(observer)
+            elevator.add_request(Request(pickup_floor=0, destination_floor=2))
+            elevator.run_until_idle(5)
+        
+        direct = BatchRecorder()
+        run(direct)
+        in_composite = BatchRecorder()
+        run(CompositeObserver([in_composite]))
+        in_queue = BatchRecorder()
+        queued = QueuedObserver(in_queue)
+        run(queued)
+        queued.close()
+        
+        assert direct.names
+        assert in_composite.names == direct.names
+        assert in_queue.names == direct.names
+    
+    def test_composite_subclass_overrides_are_called(self, recorder):
+        class CountingComposite(CompositeObserver):
+            def __init__(self, observers):
+                super().__init__(observers)
+                self.accepted = 0
+            
+            def on_request_accepted(self, state, request):
+                self.accepted += 1
+                super().on_request_accepted(state, request)
+        
+        child = recorder()
+        composite = CountingComposite([child])
+        elevator = Elevator(elevator_id=0)
+        elevator.add_observer(composite)
+        
+        request = Request(pickup_floor=0, destination_floor=5)
+        elevator.add_request(request)
+        
+        assert composite.accepted == 1
+        assert child.accepted == [request]
+    
+    def test_composite_respects_child_notify_level(self, recorder):
+        child = recorder()
+        child.notify_level = NOTIFY_REQUESTS
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        elevator.add_observer(CompositeObserver([child]))
+        request = Request(pickup_floor=0, destination_floor=2)
+        elevator.add_request(request)
+        elevator.run_until_idle(5)
+        
+        assert child.accepted == [request]
+        assert child.floors == []
+    
+    def test_composite_callbacks_are_unaffected_by_later_adds(self, recorder):
+        composite = CompositeObserver([recorder()])
+        callbacks = composite.callbacks_for("on_request_accepted")
+        
+        composite.add(recorder())
+        
+        assert len(callbacks) == 1
+        assert len(composite.callbacks_for("on_request_accepted")) == 2
+    
+    def test_metrics_observer_keeps_running_totals(self):
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        metrics = MetricsObserver()
+        elevator.add_observer(metrics)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=2, passengers=2))
+        
+        for _ in range(3):
+            elevator.step()
+        
+        metrics_dict = metrics.get_metrics()
+        assert metrics_dict["total_floor_visits"] == 2
+        assert metrics_dict["average_load"] == 2.0
+        assert metrics_dict["total_requests_completed"] == 1
+    
+    def test_metrics_observer_shared_across_elevators_sums_totals(self):
+        metrics = MetricsObserver()
+        elevators = [Elevator(elevator_id=i, start_floor=0) for i in range(2)]
+        for elevator in elevators:
+            elevator.add_observer(metrics)
+            elevator.add_request(Request(pickup_floor=0, destination_floor=1))
+        
+        for _ in range(2):
+            for elevator in elevators:
+                elevator.step()
+        
+        assert metrics.total_requests_completed == 2
+        assert metrics.total_floor_visits == 2
+    
+    def test_get_state_returns_published_snapshot_until_state_changes(self):
+        elevator = Elevator(elevator_id=0, start_floor=0)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=2))
+        
+        published = elevator.get_state()
+        assert elevator.get_state() is published
+        
+        elevator.step()
+        assert elevator.get_state() is not published
+        assert elevator.get_state().current_floor == 1
+        assert published.current_floor == 0
+    
+    def test_state_snapshots_share_stop_sets_until_stops_change(self):
+        elevator = Elevator(elevator_id=0)
+        elevator.add_request(Request(pickup_floor=0, destination_floor=5))
+        
+        first = elevator.get_state()
+        second = elevator.get_state()
+        assert first.pending_stops_up is second.pending_stops_up
+        
+        elevator.add_request(Request(pickup_floor=2, destination_floor=7))
+        third = elevator.get_state()
+        assert third.pending_stops_up is not first.pending_stops_up
+        assert third.pending_stops_up == {0, 2, 5, 7}
+    
+    def test_stop_sets_rebuilt_only_for_the_direction_that_changed(self):
+        elevator = Elevator(elevator_id=0, start_floor=5)
+        elevator.add_request(Request(pickup_floor=6, destination_floor=8))
+        elevator.add_request(Request(pickup_floor=4, destination_floor=1))
+        before = elevator.get_state()
+        
+        # Same floors again - nothing to rebuild
+        elevator.add_request(Request(pickup_floor=6, destination_floor=8))
+        after_duplicate = elevator.get_state()
+        assert after_duplicate.pending_stops_up is before.pending_stops_up
+        
+        elevator.add_request(Request(pickup_floor=7, destination_floor=9))
+        after_up_change = elevator.get_state()
+        assert after_up_change.pending_stops_up == {6, 7, 8, 9}
+        assert after_up_change.pending_stops_down is before.pending_stops_down
 
 
 class TestElevatorThreadSafety:
     """Tests for thread-safe operations."""
     
-    def test_concurrent_request_additions(self):
+    def test_concurrent_request_additions(self, executor):
         elevator = Elevator(elevator_id=0, min_floor=0, max_floor=20, capacity=100)
         
         def add_requests():
@@ -206,17 +612,15 @@ class TestElevatorThreadSafety:
                 )
                 elevator.add_request(request)
         
-        threads = [Thread(target=add_requests) for _ in range(5)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        futures = [executor.submit(add_requests) for _ in range(5)]
+        for future in futures:
+            future.result()  # Re-raises anything that failed in a worker
         
         # Elevator should have accepted all requests without crashing
         state = elevator.get_state()
         assert state.total_pending_stops > 0
     
-    def test_concurrent_state_reads(self):
+    def test_concurrent_state_reads(self, executor):
         elevator = Elevator(elevator_id=0)
         request = Request(pickup_floor=0, destination_floor=5)
         elevator.add_request(request)
@@ -224,14 +628,13 @@ class TestElevatorThreadSafety:
         states = []
         
         def read_state():
-            for _ in range(100):
+            for _ in range(250):
                 states.append(elevator.get_state())
         
-        threads = [Thread(target=read_state) for _ in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # A few workers are enough to read the published state concurrently
+        futures = [executor.submit(read_state) for _ in range(4)]
+        for future in futures:
+            future.result()
         
         assert len(states) == 1000
         assert all(s.elevator_id == 0 for s in states)
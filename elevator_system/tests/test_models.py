@@ -1,6 +1,7 @@
 """Tests for domain models."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 from elevator_system.models import Direction, DoorState, Request, ElevatorState
@@ -9,14 +10,16 @@ from elevator_system.models import Direction, DoorState, Request, ElevatorState
 class TestDirection:
     """Tests for Direction enum."""
     
-    def test_opposite_up_returns_down(self):
-        assert Direction.UP.opposite() == Direction.DOWN
-    
-    def test_opposite_down_returns_up(self):
-        assert Direction.DOWN.opposite() == Direction.UP
-    
-    def test_opposite_idle_returns_idle(self):
-        assert Direction.IDLE.opposite() == Direction.IDLE
+    @pytest.mark.parametrize(
+        "direction, expected",
+        [
+            (Direction.UP, Direction.DOWN),
+            (Direction.DOWN, Direction.UP),
+            (Direction.IDLE, Direction.IDLE),
+        ],
+    )
+    def test_opposite(self, direction, expected):
+        assert direction.opposite() == expected
 
 
 class TestRequest:
@@ -46,7 +49,8 @@ class TestRequest:
     
     def test_request_floors_to_serve(self):
         request = Request(pickup_floor=3, destination_floor=7)
-        assert request.floors_to_serve == frozenset({3, 7})
+        assert request.floors_to_serve == (3, 7)
+        assert Request(pickup_floor=7, destination_floor=3).floors_to_serve == (3, 7)
     
     def test_request_equality_by_id(self):
         request1 = Request(pickup_floor=0, destination_floor=5)
@@ -56,6 +60,13 @@ class TestRequest:
         assert request1 != request2
         assert request1 == request1
     
+    def test_request_ids_increase(self):
+        first = Request(pickup_floor=0, destination_floor=5)
+        second = Request(pickup_floor=0, destination_floor=5)
+        
+        assert isinstance(first.id, int)
+        assert second.id > first.id
+    
     def test_request_is_immutable(self):
         request = Request(pickup_floor=0, destination_floor=5)
         with pytest.raises(AttributeError):
@@ -136,6 +147,19 @@ class TestElevatorState:
         )
         assert state.total_pending_stops == 5
     
+    def test_state_is_immutable(self):
+        state = ElevatorState(
+            elevator_id=0,
+            current_floor=5,
+            direction=Direction.UP,
+            door_state=DoorState.CLOSED,
+            current_load=2,
+            capacity=8,
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            state.current_floor = 6
+    
     def test_copy_creates_independent_state(self):
         original = ElevatorState(
             elevator_id=0,
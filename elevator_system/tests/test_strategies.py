@@ -163,6 +163,86 @@ class TestZonedDispatchStrategy:
         
         # Should fall back to nearest (elevator2 is closer to floor 12)
         assert selected is elevator2
+    
+    def test_zone_change_applies_to_later_requests(self):
+        strategy = ZonedDispatchStrategy()
+        
+        elevator1 = Elevator(elevator_id=0, min_floor=0, max_floor=20, start_floor=0)
+        elevator2 = Elevator(elevator_id=1, min_floor=0, max_floor=20, start_floor=20)
+        strategy.set_zone(elevator1.id, min_floor=0, max_floor=20)
+        
+        request = Request(pickup_floor=15, destination_floor=18)
+        assert strategy.select_elevator(request, [elevator1, elevator2]) is elevator1
+        
+        strategy.set_zone(elevator1.id, min_floor=0, max_floor=5)
+        strategy.set_zone(elevator2.id, min_floor=6, max_floor=20)
+        
+        assert strategy.select_elevator(request, [elevator1, elevator2]) is elevator2
+
+    
+    def test_set_zone_during_dispatch_is_safe(self, executor):
+        strategy = ZonedDispatchStrategy({0: (0, 20)})
+        elevators = [
+            Elevator(elevator_id=i, min_floor=0, max_floor=20, start_floor=0)
+            for i in range(3)
+        ]
+        
+        def rezone():
+            for i in range(200):
+                # New ids grow the assignments while dispatch reads them
+                strategy.set_zone(100 + i, min_floor=0, max_floor=20)
+        
+        def dispatch():
+            for i in range(200):
+                request = Request(pickup_floor=i % 20, destination_floor=20)
+                strategy.select_elevator(request, elevators)
+        
+        futures = [executor.submit(rezone), executor.submit(dispatch)]
+        for future in futures:
+            future.result()  # Re-raises anything that failed in a worker
+        
+        # The last change is visible, not a zone cache from before it
+        strategy.set_zone(0, min_floor=0, max_floor=5)
+        strategy.set_zone(1, min_floor=6, max_floor=20)
+        request = Request(pickup_floor=15, destination_floor=18)
+        assert strategy.select_elevator(request, elevators) is elevators[1]
+    
+    def test_zone_assignments_are_copied(self):
+        zones = {0: (0, 20)}
+        strategy = ZonedDispatchStrategy(zones)
+        
+        elevator1 = Elevator(elevator_id=0, min_floor=0, max_floor=20, start_floor=0)
+        elevator2 = Elevator(elevator_id=1, min_floor=0, max_floor=20, start_floor=20)
+        request = Request(pickup_floor=15, destination_floor=18)
+        assert strategy.select_elevator(request, [elevator1, elevator2]) is elevator1
+        
+        # Changing the caller's dict must not leave a half-stale zone cache
+        zones[0] = (0, 5)
+        zones[1] = (6, 20)
+        
+        assert strategy.select_elevator(request, [elevator1, elevator2]) is elevator1
+
+class TestBatchSelection:
+    """Tests for the batched selection entry point."""
+    
+    def test_default_batch_matches_per_request_selection(self):
+        strategy = NearestElevatorStrategy()
+        
+        elevator1 = Elevator(elevator_id=0, max_floor=10, start_floor=0)
+        elevator2 = Elevator(elevator_id=1, max_floor=10, start_floor=10)
+        elevators = [elevator1, elevator2]
+        
+        requests = [
+            Request(pickup_floor=1, destination_floor=5),
+            Request(pickup_floor=9, destination_floor=2),
+            Request(pickup_floor=12, destination_floor=3),  # Out of range
+        ]
+        
+        assert strategy.select_elevators_batch(requests, elevators) == [
+            elevator1,
+            elevator2,
+            None,
+        ]
 
 
 